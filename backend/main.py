@@ -9,16 +9,20 @@ import uvicorn
 import os
 import json
 import asyncio
-import hashlib
+import math
+import time
 from contextlib import asynccontextmanager
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+import re
 import uuid
 from pathlib import Path
 import argparse
 import yaml
 
-from models import SessionLocal, User, Question, Game, Answer, switch_database, SQLALCHEMY_DATABASE_URL
+from models import SessionLocal, User, Question, Game, Answer, switch_database, normalize_answer_content, question_content_hash, SQLALCHEMY_DATABASE_URL
+from sqlalchemy import case, func
+from sqlalchemy.orm import joinedload
 
 from collections import Counter, defaultdict
 
@@ -82,6 +86,52 @@ def compute_numeric_score(correct_str: str, user_str: str, max_score: int = 30)
     except Exception:
         return 0
 
+def _top10_score_updates(correct_num, answers):
+    """
+    Score updates for one fill-in-the-blank question's (answer_id, content) pairs.
+    Exact matches get 30 points, the 10 closest non-exact answers 1-25 points, other numeric answers 0.
+    """
+    updates = []
+    non_exact_answers = []
+
+    for answer_id, content in answers:
+        user_num = extract_number_from_text(content)
+        if user_num is None:
+            continue
+        if user_num == correct_num:
+            # Exact match - ensure it gets 30 points
+            updates.append({"id": answer_id, "score": 30, "is_correct": True})
+        else:
+            # Non-exact - calculate difference for ranking
+            non_exact_answers.append((answer_id, abs(user_num - correct_num)))
+
+    # Sort non-exact answers by difference (closest first)
+    non_exact_answers.sort(key=lambda x: x[1])
+
+    # Take top 10 closest
+    top_10 = non_exact_answers[:10]
+
+    if not top_10:
+        return updates
+
+    # Assign proportional scores to top 10
+    # Closer answers get higher proportional scores
+    max_diff = top_10[-1][1]
+
+    for answer_id, diff in top_10:
+        if max_diff == 0:
+            proportional_score = 25  # All equally close
+        else:
+            # Closer (smaller diff) gets higher score
+            closeness_ratio = 1 - (diff / max_diff)
+            proportional_score = int(25 * closeness_ratio) + 1  # 1-25 points
+        updates.append({"id": answer_id, "score": proportional_score, "is_correct": False})
+
+    # Set score = 0 for all other non-exact answers (not in top 10)
+    updates.extend({"id": answer_id, "score": 0, "is_correct": False} for answer_id, _ in non_exact_answers[10:])
+
+    return updates
+
 def compute_top10_proportional_scores(db, question_id, game_id, correct_answer):
     """
     Compute proportional scores for the top 10 closest non-exact answers.
@@ -92,61 +142,56 @@ def compute_top10_proportional_scores(db, question_id, game_id, correct_answer):
         if correct_num is None:
             return
 
-        # Get all answers for this question that are not exact matches
-        answers = db.query(Answer).filter(
+        # Only id and content are needed for ranking
+        answers = db.query(Answer.id, Answer.content).filter(
             Answer.question_id == question_id,
             Answer.game_id == game_id
-        ).all()
-
-        non_exact_answers = []
-        exact_answer_ids = []
+        ).order_by(Answer.id).all()
 
-        for ans in answers:
-            user_num = extract_number_from_text(ans.content)
-            if user_num is None:
-                continue
-            if user_num == correct_num:
-                # Exact match - ensure it gets 30 points
-                ans.score = 30
-                ans.is_correct = True
-                exact_answer_ids.append(ans.id)
-            else:
-                # Non-exact - calculate difference for ranking
-                diff = abs(user_num - correct_num)
-                non_exact_answers.append((ans, diff))
-
-        # Sort non-exact answers by difference (closest first)
-        non_exact_answers.sort(key=lambda x: x[1])
-
-        # Take top 10 closest
-        top_10 = non_exact_answers[:10]
-
-        if not top_10:
+        updates = _top10_score_updates(correct_num, answers)
+        if not updates:
             return
 
-        # Assign proportional scores to top 10
-        # Closer answers get higher proportional scores
-        max_diff = max(diff for _, diff in top_10) if top_10 else 1
+        db.bulk_update_mappings(Answer, updates)
+        db.commit()
+        mark_answers_changed()
+
+    except Exception as e:
+        print(f"Error computing top 10 proportional scores: {e}")
 
-        for i, (ans, diff) in enumerate(top_10):
-            if max_diff == 0:
-                proportional_score = 25  # All equally close
-            else:
-                # Closer (smaller diff) gets higher score
-                closeness_ratio = 1 - (diff / max_diff)
-                proportional_score = int(25 * closeness_ratio) + 1  # 1-25 points
+def compute_top10_proportional_scores_bulk(db, game_id, question_ids=None):
+    """
+    compute_top10_proportional_scores for many fill-in-the-blank questions of a game at once:
+    one query for all their answers, one executemany UPDATE and one commit.
+    Scores every fill-in-the-blank question in the game when question_ids is None.
+    """
+    try:
+        query = db.query(Answer.id, Answer.content, Answer.question_id, Question.correct_answer).join(
+            Question, Question.id == Answer.question_id
+        ).filter(
+            Answer.game_id == game_id,
+            Question.type == "fill_in_the_blank"
+        )
+        if question_ids is not None:
+            query = query.filter(Answer.question_id.in_(question_ids))
 
-            ans.score = proportional_score
-            ans.is_correct = False
+        # Group answers per question, keeping insertion order for tie-breaking
+        answers_by_question = {}
+        for answer_id, content, question_id, correct_answer in query.order_by(Answer.id):
+            answers_by_question.setdefault((question_id, correct_answer), []).append((answer_id, content))
 
-        # Set score = 0 for all other non-exact answers (not in top 10)
-        top_10_ids = {ans.id for ans, _ in top_10}
-        for ans, _ in non_exact_answers:
-            if ans.id not in top_10_ids:
-                ans.score = 0
-                ans.is_correct = False
+        updates = []
+        for (question_id, correct_answer), answers in answers_by_question.items():
+            correct_num = extract_number_from_text(correct_answer)
+            if correct_num is not None:
+                updates.extend(_top10_score_updates(correct_num, answers))
 
+        if not updates:
+            return
+
+        db.bulk_update_mappings(Answer, updates)
         db.commit()
+        mark_answers_changed()
 
     except Exception as e:
         print(f"Error computing top 10 proportional scores: {e}")
@@ -213,18 +258,17 @@ def cluster_word_cloud_answers(answers, similarity_threshold=0.7):
     cosine_scores = util.pytorch_cos_sim(embeddings, embeddings).cpu().numpy()
 
     n = len(answers)
-    visited = [False] * n
+    # Threshold the whole matrix at once; only keep pairs (i, j) with j > i
+    similar = np.triu(cosine_scores >= similarity_threshold, k=1)
+    visited = np.zeros(n, dtype=bool)
     clusters = []
     for i in range(n):
         if not visited[i]:
-            # Group all answers with cosine similarity >= threshold to i
-            cluster = [i]
+            # Group all not-yet-clustered answers with cosine similarity >= threshold to i
+            members = np.flatnonzero(similar[i] & ~visited)
             visited[i] = True
-            for j in range(i+1, n):
-                if not visited[j] and cosine_scores[i,j] >= similarity_threshold:
-                    cluster.append(j)
-                    visited[j] = True
-            clusters.append(cluster)
+            visited[members] = True
+            clusters.append([i, *members.tolist()])
 
     cluster_map = {}
     answer_to_cluster = {}
@@ -240,6 +284,14 @@ def cluster_word_cloud_answers(answers, similarity_threshold=0.7):
 
     return cluster_map, answer_to_cluster
 
+async def run_blocking(fn, *args, **kwargs):
+    """Run blocking SQLite work (commits, heavier queries) in a worker thread so the event loop keeps serving sockets"""
+    return await asyncio.to_thread(fn, *args, **kwargs)
+
+def encode_message(message: dict) -> str:
+    """Serialize a websocket message once for broadcast_text (same encoding as Starlette's send_json)"""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
 # Connection managers
 class ConnectionManager:
     def __init__(self):
@@ -257,11 +309,13 @@ class ConnectionManager:
         print(f"New {user_type} connection: {connection_id}")
         return connection_id
 
+    def _remove(self, connection_id: str):
+        """Forget a connection; the single place entries leave both maps so they never drift apart"""
+        self.active_connections.pop(connection_id, None)
+        self.user_sessions.pop(connection_id, None)
+
     def disconnect(self, connection_id: str):
-        if connection_id in self.active_connections:
-            del self.active_connections[connection_id]
-        if connection_id in self.user_sessions:
-            del self.user_sessions[connection_id]
+        self._remove(connection_id)
         print(f"Connection disconnected: {connection_id}")
 
     async def send_personal_message(self, message: dict, connection_id: str):
@@ -270,8 +324,7 @@ class ConnectionManager:
                 await self.active_connections[connection_id].send_json(message)
             except Exception:
                 # Silently ignore errors when sending to a closed connection
-                if connection_id in self.active_connections:
-                    del self.active_connections[connection_id]
+                self._remove(connection_id)
 
     async def broadcast(self, message: dict, exclude_connections: Optional[set] = None):
         exclude_connections = exclude_connections or set()
@@ -282,11 +335,24 @@ class ConnectionManager:
                     await connection.send_json(message)
                 except Exception:
                     # Silently ignore errors when broadcasting to a closed connection
-                    if connection_id in self.active_connections:
-                        del self.active_connections[connection_id]
+                    self._remove(connection_id)
+
+    async def broadcast_text(self, text: str, exclude_connections: Optional[set] = None):
+        """Broadcast an already-serialized JSON message, so it is encoded once rather than per socket"""
+        exclude_connections = exclude_connections or set()
+        for connection_id, connection in list(self.active_connections.items()):
+            if connection_id not in exclude_connections:
+                try:
+                    await connection.send_text(text)
+                except Exception:
+                    # Silently ignore errors when broadcasting to a closed connection
+                    self._remove(connection_id)
 
     def get_participant_count(self):
-        return len(self.active_connections)
+        return len(self.active_connections)  # dict length is O(1); no separate counter to keep in sync
+
+    def has_connections(self) -> bool:
+        return bool(self.active_connections)
 
 # Global connection managers
 participant_manager = ConnectionManager()
@@ -298,14 +364,46 @@ current_question: Optional[Question] = None
 current_question_index: int = 0
 total_questions: int = 0
 question_timer: Optional[asyncio.Task] = None
-question_start_time: Optional[float] = None  # Timestamp when current question was pushed
+question_start_time: Optional[float] = None  # time.monotonic() when current question was pushed
+# Plain copies of what the periodic status update reports, refreshed on game/question transitions
+# so the poll never touches ORM attributes (and can't trigger a lazy load on a stale instance)
+game_active: bool = False
+current_question_snapshot: Dict[str, Optional[object]] = {"id": None, "content": None, "type": None}
+
+def snapshot_current_question():
+    """Refresh current_question_snapshot after current_question changes or is edited"""
+    global current_question_snapshot
+    current_question_snapshot = {
+        "id": current_question.id if current_question else None,
+        "content": current_question.content if current_question else None,
+        "type": current_question.type if current_question else None,
+    }
 
 # --- Wheel of Fortune state ---
 wof_revealed_indices: Optional[List[bool]] = None  # Indices in current phrase that are revealed (now List[bool])
+wof_word_spans: Optional[List[Tuple[int, int]]] = None  # (start, end) of each word in the phrase, computed once per question
+wof_unique_letters: int = 0                      # Distinct letters in the phrase, used for countdown length
+wof_letter_positions: Dict[str, List[int]] = {}  # Uppercase letter -> indices where it appears in the phrase
+wof_hidden_letters: set = set()                  # Letters not yet revealed by the reveal engine
 wof_reveal_task: Optional[asyncio.Task] = None   # Background tile reveal task
 wof_winner: Optional[str] = None                 # Winning participant name
 wof_tile_duration: float = SETTINGS.get('wof_tile_duration', 2.0)  # seconds per tile (loaded from settings)
 
+# --- Leaderboard cache ---
+# get_cumulative_scores is polled every 2s; only recompute after an answer/score write
+# (or once the TTL lapses as a safety net for writes from outside this process; the
+# admin status loop refreshes at least that often so the lapse is picked up)
+LEADERBOARD_CACHE_TTL = 60.0
+_leaderboard_cache = {"game_id": None, "data": [], "dirty": True, "ts": 0.0}
+_leaderboard_lock: Optional[asyncio.Lock] = None  # Created lazily inside the running loop
+answers_revision: int = 0  # Bumped on every Answer write so pollers can tell when nothing changed
+
+def mark_answers_changed():
+    """Record a write to Answer rows or scores: bump the revision and mark the cached leaderboard stale"""
+    global answers_revision
+    answers_revision += 1
+    _leaderboard_cache["dirty"] = True
+
 async def cleanup_database():
     """Clean up users and answers tables at startup for fresh sessions"""
     db = SessionLocal()
@@ -314,6 +412,7 @@ async def cleanup_database():
         db.query(Answer).delete()
         db.query(User).delete()
         db.commit()
+        mark_answers_changed()
         print("Database cleaned: users and answers tables cleared")
     except Exception as e:
         print(f"Error cleaning database: {e}")
@@ -501,25 +600,13 @@ async def import_questions_api(request: dict):
                 db.commit()
                 dropped = existing_count
 
-        def calculate_question_hash(question_data):
-            """Calculate hash for deduplication"""
-            hash_content = f"{question_data['type']}|{question_data['content']}|{question_data['correct_answer']}"
-            if question_data.get("answers"):
-                hash_content += f"|{'|'.join(sorted(question_data['answers']))}"
-            return hashlib.sha256(hash_content.encode('utf-8')).hexdigest()
-
         # Get existing questions for duplicate checking (only if not dropping all)
         existing_hashes = {}
         if not drop_existing and (skip_duplicates or update_existing):
-            existing_questions = db.query(Question).all()
-            for eq in existing_questions:
-                hash_data = {
-                    "type": eq.type,
-                    "content": eq.content,
-                    "correct_answer": eq.correct_answer,
-                    "answers": json.loads(eq.answers) if eq.answers else None
-                }
-                existing_hashes[calculate_question_hash(hash_data)] = eq
+            existing_hashes = dict(db.query(Question.content_hash, Question.id).all())
+
+        # Next free order value, fetched once (the row count collides once questions have been deleted)
+        next_order = db.query(func.coalesce(func.max(Question.order), -1) + 1).scalar()
 
         for question_data in import_data:
             # Basic validation
@@ -533,13 +620,14 @@ async def import_questions_api(request: dict):
             question_hash = calculate_question_hash(question_data)
 
             # Check for existing question
-            existing_question = existing_hashes.get(question_hash)
-            if existing_question and not drop_existing:
+            existing_id = existing_hashes.get(question_hash)
+            if existing_id is not None and not drop_existing:
                 if skip_duplicates and not update_existing:
                     skipped += 1
                     continue
                 elif update_existing:
-                    # Update existing question
+                    # Update existing question (only matched rows are loaded)
+                    existing_question = db.get(Question, existing_id)
                     existing_question.type = question_data["type"]
                     existing_question.content = question_data["content"]
                     existing_question.correct_answer = question_data["correct_answer"]
@@ -560,7 +648,7 @@ async def import_questions_api(request: dict):
                 correct_answer=question_data["correct_answer"],
                 allow_multiple=question_data.get("allow_multiple", True),
                 answers=json.dumps(question_data["answers"]) if question_data.get("answers") else None,
-                order=question_data.get("order", db.query(Question).count())
+                order=question_data.get("order", next_order + imported)
             )
 
             db.add(new_question)
@@ -710,8 +798,8 @@ async def participant_websocket(websocket: WebSocket):
             session_id=connection_id
         )
         db.add(participant)
-        db.commit()
-        db.refresh(participant)
+        await run_blocking(db.commit)
+        await run_blocking(db.refresh, participant)
 
         # Send current game state if quiz is active
         if current_game and current_game.status == "active":
@@ -750,8 +838,10 @@ async def participant_websocket(websocket: WebSocket):
                         Answer.game_id == game_id
                     ).first()
                     
-                    is_word_cloud = current_question and current_question.type == "word_cloud"
-                    is_wof = current_question and current_question.type == "wheel_of_fortune"
+                    # Read the question type once and reuse it for the rest of this answer
+                    q_type = current_question.type if current_question else None
+                    is_word_cloud = q_type == "word_cloud"
+                    is_wof = q_type == "wheel_of_fortune"
                     is_correct = False
                     score = 0
 
@@ -778,7 +868,7 @@ async def participant_websocket(websocket: WebSocket):
                         if is_correct:
                             seconds_remaining = 30
                             if question_start_time is not None:
-                                elapsed_time = asyncio.get_event_loop().time() - question_start_time
+                                elapsed_time = time.monotonic() - question_start_time
                                 seconds_remaining = max(0, 30 - int(elapsed_time))
                             score = seconds_remaining
                         else:
@@ -787,6 +877,7 @@ async def participant_websocket(websocket: WebSocket):
                         # Insert a new Answer or update previous
                         if existing:
                             existing.content = data["answer"]
+                            existing.content_norm = normalize_answer_content(data["answer"])
                             existing.is_correct = is_correct
                             existing.score = score
                             existing.retry_count += 1
@@ -802,7 +893,8 @@ async def participant_websocket(websocket: WebSocket):
                                 retry_count=1
                             )
                             db.add(answer_obj)
-                        db.commit()
+                        await run_blocking(db.commit)
+                        mark_answers_changed()
                         if not existing:
                             existing = answer_obj
 
@@ -823,7 +915,7 @@ async def participant_websocket(websocket: WebSocket):
 
                     # CUSTOM: For word_cloud, always accept and ignore is_correct/scoring at this stage
                     if current_question and data["question_id"] == current_question.id and not is_word_cloud and not is_wof:
-                        if current_question.type == "fill_in_the_blank":
+                        if q_type == "fill_in_the_blank":
                             # Use numerical scoring for fill_in_the_blank
                             score = compute_numeric_score(
                                 current_question.correct_answer or "",
@@ -831,7 +923,7 @@ async def participant_websocket(websocket: WebSocket):
                             )
                             is_correct = score > 0
                             print(f"[NUMERIC DEBUG] fill_in_the_blank scoring: user='{data['answer']}', correct='{current_question.correct_answer}', score={score}, is_correct={is_correct}")
-                        elif current_question.type == "pictionary":
+                        elif q_type == "pictionary":
                             # Use semantic similarity for pictionary questions
                             score, similarity = compute_semantic_score(
                                 current_question.correct_answer or "",
@@ -843,17 +935,18 @@ async def participant_websocket(websocket: WebSocket):
                             # Use exact matching for other question types (like wheel_of_fortune full phrase)
                             is_correct = (data["answer"].strip().lower() == current_question.correct_answer.strip().lower())
                             if is_correct and question_start_time is not None:
-                                elapsed_time = asyncio.get_event_loop().time() - question_start_time
+                                elapsed_time = time.monotonic() - question_start_time
                                 seconds_remaining = max(0, 30 - elapsed_time)
                                 score = int(seconds_remaining)  # Convert to integer seconds
                             else:
                                 score = 0
-                            print(f"[EXACT DEBUG] {current_question.type} scoring: user='{data['answer']}', correct='{current_question.correct_answer}', is_correct={is_correct}, score={score}")
+                            print(f"[EXACT DEBUG] {q_type} scoring: user='{data['answer']}', correct='{current_question.correct_answer}', is_correct={is_correct}, score={score}")
 
                     if not is_wof:
                         if existing and (not existing.is_correct or is_word_cloud):
                             # Update existing answer
                             existing.content = data["answer"]
+                            existing.content_norm = normalize_answer_content(data["answer"])
                             existing.is_correct = is_correct
                             existing.score = score
                             existing.retry_count += 1
@@ -871,13 +964,14 @@ async def participant_websocket(websocket: WebSocket):
                             )
                             db.add(answer)
 
-                        db.commit()
+                        await run_blocking(db.commit)
+                        mark_answers_changed()
 
                     game_id = getattr(current_game, "id", None)
-                    user_answers = db.query(Answer).filter(
+                    user_answers = await run_blocking(db.query(Answer).filter(
                         Answer.user_id == participant.id,
                         Answer.game_id == game_id
-                    ).all()
+                    ).all)
                     total_score = sum(ans.score for ans in user_answers)
 
                     # Send personal feedback to participant
@@ -904,18 +998,18 @@ async def participant_websocket(websocket: WebSocket):
                         }, connection_id)
                         print(f"[SCORING DEBUG] Answer from {participant.name}: correct={is_correct}, score={score}, total_score={total_score}")
 
-                    # Notify admin of updated answers
-                    answers, _ = await get_current_answers(db)
-                    # Don't update leaderboard for word cloud questions (no scoring)
-                    is_word_cloud = current_question and current_question.type == "word_cloud"
-                    leaderboard = [] if is_word_cloud else await get_cumulative_scores(db)
-                    print(f"[SCORING DEBUG] Broadcasting to admin: {len(answers)} answers, leaderboard has {len(leaderboard)} entries")
-                    await admin_manager.broadcast({
-                        "type": "answer_received",
-                        "question_type": getattr(current_question, 'type', None),
-                        "answers": answers,
-                        "leaderboard": leaderboard
-                    })
+                    # Notify admin of updated answers (skip the answer/leaderboard queries if nobody is watching)
+                    if admin_manager.has_connections():
+                        answers, _ = await get_current_answers(db)
+                        # Don't update leaderboard for word cloud questions (no scoring)
+                        leaderboard = [] if is_word_cloud else await get_cumulative_scores(db)
+                        print(f"[SCORING DEBUG] Broadcasting to admin: {len(answers)} answers, leaderboard has {len(leaderboard)} entries")
+                        await admin_manager.broadcast({
+                            "type": "answer_received",
+                            "question_type": q_type,
+                            "answers": answers,
+                            "leaderboard": leaderboard
+                        })
 
                     # --- NEW: Auto-scoring for word_cloud when all have answered ---
                     if is_word_cloud and not word_cloud_scored:
@@ -946,18 +1040,18 @@ ALLOWED_QUESTION_TYPES = {
 }
 
 def calculate_question_hash(question_data):
-    """Calculate hash for deduplication"""
-    hash_content = f"{question_data['type']}|{question_data['content']}|{question_data['correct_answer']}"
-    if question_data.get("answers"):
-        hash_content += f"|{'|'.join(sorted(question_data['answers']))}"
-    return hashlib.sha256(hash_content.encode('utf-8')).hexdigest()
+    """Calculate hash for deduplication (same digest as the stored Question.content_hash)"""
+    return question_content_hash(
+        question_data['type'], question_data['content'], question_data['correct_answer'], question_data.get("answers")
+    )
 
 @app.websocket("/ws/admin")
 async def admin_websocket(websocket: WebSocket):
     # Declare all global variables at function start to avoid "used before global declaration" errors
-    global current_game, current_question, current_question_index, total_questions
+    global current_game, current_question, current_question_index, total_questions, game_active
     global question_timer, question_start_time, word_cloud_scored
-    global wof_revealed_indices, wof_reveal_task, wof_winner, wof_tile_duration
+    global wof_revealed_indices, wof_word_spans, wof_unique_letters, wof_letter_positions, wof_hidden_letters
+    global wof_reveal_task, wof_winner, wof_tile_duration
 
     # Establish connection and obtain a unique connection ID
     connection_id = await admin_manager.connect(websocket, "admin")
@@ -1044,7 +1138,7 @@ async def admin_websocket(websocket: WebSocket):
                         answers=json.dumps(qd.get("options", [])) if "options" in qd else None,
                     )
                     db.add(new_question)
-                    db.commit()
+                    await run_blocking(db.commit)
                     await admin_manager.send_personal_message({"type": "question_added"}, connection_id)
                 elif data["type"] == "edit_question":
                     idx = data.get("index")
@@ -1060,7 +1154,9 @@ async def admin_websocket(websocket: WebSocket):
                         question.allow_multiple = qd.get("allow_multiple", question.allow_multiple)
                         if "options" in qd:
                             question.answers = json.dumps(qd["options"])
-                        db.commit()
+                        await run_blocking(db.commit)
+                        if current_question is not None and current_question.id == question.id:
+                            snapshot_current_question()
                         await admin_manager.send_personal_message({"type": "question_updated"}, connection_id)
                 elif data["type"] == "get_questions":
                     # Sort questions by .order if present; fallback to id for legacy
@@ -1090,20 +1186,23 @@ async def admin_websocket(websocket: WebSocket):
                     order_field_exists = hasattr(Question, "order")
                     # Only proceed if .order field exists (otherwise suggest migration)
                     if order_field_exists and id_list:
-                        for idx, qid in enumerate(id_list):
-                            qobj = db.query(Question).filter(Question.id == qid).first()
-                            if qobj:
-                                setattr(qobj, "order", idx)
-                        db.commit()
+                        # Unknown ids are skipped; bulk UPDATE raises if a row is missing
+                        existing_ids = {qid for (qid,) in db.query(Question.id).filter(Question.id.in_(id_list))}
+                        db.bulk_update_mappings(Question, [
+                            {"id": qid, "order": idx}
+                            for idx, qid in enumerate(id_list)
+                            if qid in existing_ids
+                        ])
+                        await run_blocking(db.commit)
                         await admin_manager.send_personal_message({"type": "questions_reordered"}, connection_id)
                     else:
                         await admin_manager.send_personal_message({"type": "questions_reorder_failed"}, connection_id)
                 elif data["type"] == "delete_question":
                     idx = data["index"]
-                    ordered = db.query(Question).order_by(Question.id).all()
-                    if 0 <= idx < len(ordered):
-                        db.delete(ordered[idx])
-                        db.commit()
+                    question = db.query(Question).order_by(Question.id).offset(idx).limit(1).first() if idx >= 0 else None
+                    if question:
+                        db.delete(question)
+                        await run_blocking(db.commit)
                         await admin_manager.send_personal_message({"type": "question_deleted"}, connection_id)
                 # ---------- Settings ----------
                 elif data["type"] == "save_settings":
@@ -1127,12 +1226,18 @@ async def admin_websocket(websocket: WebSocket):
 
                             current_game = None
                             current_question = None
+                            game_active = False
+                            snapshot_current_question()
                             current_question_index = 0
                             total_questions = 0
                             question_timer = None
                             question_start_time = None
                             word_cloud_scored = False
                             wof_revealed_indices = None
+                            wof_word_spans = None
+                            wof_unique_letters = 0
+                            wof_letter_positions = {}
+                            wof_hidden_letters = set()
                             wof_reveal_task = None
                             wof_winner = None
 
@@ -1182,10 +1287,8 @@ async def admin_websocket(websocket: WebSocket):
                 # ---------- Start WoF Countdown ----------
                 elif data["type"] == "start_wof_countdown":
                     if current_question and current_question.type == "wheel_of_fortune":
-                        phrase = current_question.correct_answer or ""
-                        unique_letters = len(set(c.upper() for c in phrase if c.isalpha()))
-                        timer_duration = int(unique_letters * wof_tile_duration)
-                        print(f"[WoF] Starting countdown with duration: {timer_duration}s ({unique_letters} unique letters × {wof_tile_duration}s)")
+                        timer_duration = int(wof_unique_letters * wof_tile_duration)
+                        print(f"[WoF] Starting countdown with duration: {timer_duration}s ({wof_unique_letters} unique letters × {wof_tile_duration}s)")
 
                         # Send initial display update to show word-formatted board immediately
                         await broadcast_wof_state(current_question.correct_answer or "")
@@ -1254,15 +1357,17 @@ async def admin_websocket(websocket: WebSocket):
 
 # Game management functions
 async def start_quiz(db):
-    global current_game, current_question_index, total_questions
+    global current_game, current_question_index, total_questions, game_active
     # Clear all previous answers and participant scores for a fresh leaderboard
     db.query(Answer).delete()
     db.commit()
+    mark_answers_changed()
 
     current_game = Game(status="active")
     db.add(current_game)
     db.commit()
     db.refresh(current_game)
+    game_active = True
 
     # Initialize question progress
     total_questions = db.query(Question).count()
@@ -1271,7 +1376,8 @@ async def start_quiz(db):
 
 async def next_question(db):
     global current_question, question_timer, current_question_index, question_start_time
-    global wof_revealed_indices, wof_reveal_task, wof_winner
+    global wof_revealed_indices, wof_word_spans, wof_unique_letters, wof_letter_positions, wof_hidden_letters
+    global wof_reveal_task, wof_winner
 
     # Only allow next question if quiz is active and not exhausted
     if not current_game or current_game.status != "active":
@@ -1299,15 +1405,20 @@ async def next_question(db):
         wof_reveal_task = None
 
     wof_revealed_indices = None
+    wof_word_spans = None
+    wof_unique_letters = 0
+    wof_letter_positions = {}
+    wof_hidden_letters = set()
     wof_winner = None
 
     # Get next question IN PERSISTED ORDER
     question = db.query(Question).order_by(getattr(Question, "order", Question.id)).offset(current_question_index).first()
     if question:
         current_question = question
+        snapshot_current_question()
         current_question_index += 1
         # Record when this question was pushed for time-based scoring
-        question_start_time = asyncio.get_event_loop().time()
+        question_start_time = time.monotonic()
 
         # For WoF, initialize state but don't start reveal yet (wait for countdown)
         if question.type == "wheel_of_fortune":
@@ -1317,6 +1428,15 @@ async def next_question(db):
             for idx, c in enumerate(phrase):
                 if not c.isalnum():
                     wof_revealed_indices[idx] = True
+            # Phrase structure never changes during the round, so compute it once here
+            wof_word_spans = [m.span() for m in re.finditer(r"\S+", phrase)]
+            positions = defaultdict(list)
+            for idx, c in enumerate(phrase):
+                if c.isalpha():
+                    positions[c.upper()].append(idx)
+            wof_letter_positions = dict(positions)
+            wof_hidden_letters = set(positions)
+            wof_unique_letters = len(positions)
             # Don't start reveal engine yet - wait for start_wof_countdown
 
 async def wof_phrase_reveal_engine(phrase):
@@ -1330,33 +1450,21 @@ async def wof_phrase_reveal_engine(phrase):
     try:
         if wof_revealed_indices is None:
             return
-        while not all(wof_revealed_indices):
-            # Find all indices that are still hidden (not revealed and are letters)
-            hidden_indices = []
-            for idx, revealed in enumerate(wof_revealed_indices):
-                if not revealed and phrase[idx].isalpha():
-                    hidden_indices.append(idx)
-
-            if not hidden_indices:
-                # No more letters to reveal
-                await broadcast_wof_state(phrase, finished=True)
-                break
-
-            # Randomly select one hidden index
-            selected_idx = random.choice(hidden_indices)
-            selected_letter = phrase[selected_idx].upper()
+        while wof_hidden_letters:
+            # Pick a hidden letter, weighted by how often it appears in the phrase
+            hidden = list(wof_hidden_letters)
+            selected_letter = random.choices(hidden, weights=[len(wof_letter_positions[c]) for c in hidden])[0]
+            wof_hidden_letters.discard(selected_letter)
 
             # Reveal ALL instances of this letter in the phrase
-            for idx, char in enumerate(phrase):
-                if char.upper() == selected_letter:
-                    wof_revealed_indices[idx] = True
+            for idx in wof_letter_positions[selected_letter]:
+                wof_revealed_indices[idx] = True
 
             await broadcast_wof_state(phrase)
-            # If puzzle is now complete with no winner, broadcast solution/end
-            if all(wof_revealed_indices):
-                await broadcast_wof_state(phrase, finished=True)
-                break
-            await asyncio.sleep(wof_tile_duration)
+            if wof_hidden_letters:
+                await asyncio.sleep(wof_tile_duration)
+        # Puzzle is complete with no winner, broadcast solution/end
+        await broadcast_wof_state(phrase, finished=True)
     except asyncio.CancelledError:
         # Clean up if question is skipped/canceled
         pass
@@ -1367,36 +1475,25 @@ async def broadcast_wof_state(phrase, finished=False, winner=None):
     Participants see the board via screen share.
     """
     words = []
-    if wof_revealed_indices is not None:
-        # Split phrase into words by spaces
-        phrase_words = phrase.split()
-        idx = 0
-        for word in phrase_words:
-            word_display = ""
-            for char in word:
-                if wof_revealed_indices[idx]:
-                    word_display += char
-                elif char.isalpha():
-                    word_display += "_"
-                else:
-                    word_display += char
-                idx += 1
-            # Skip the space character after each word (except last)
-            if idx < len(phrase) and phrase[idx] == ' ':
-                idx += 1
-            words.append(word_display)
+    if wof_revealed_indices is not None and wof_word_spans is not None:
+        # Mask each precomputed word span; hidden letters render as "_"
+        for start, end in wof_word_spans:
+            words.append("".join(
+                char if wof_revealed_indices[idx] or not char.isalpha() else "_"
+                for idx, char in enumerate(phrase[start:end], start)
+            ))
 
     # Only send to admin - participants see via screen share
-    await admin_manager.broadcast({
+    await admin_manager.broadcast_text(encode_message({
         "type": "wof_update",
         "words": words,
         "revealed_indices": wof_revealed_indices,
         "winner": winner,
         "finished": finished
-    })
+    }))
 
 async def end_quiz(db):
-    global current_game, current_question, question_timer
+    global current_game, current_question, question_timer, game_active
 
     if current_game:
         current_game.status = "finished"
@@ -1405,11 +1502,41 @@ async def end_quiz(db):
 
     current_game = None
     current_question = None
+    game_active = False
+    snapshot_current_question()
 
     if question_timer:
         question_timer.cancel()
         question_timer = None
 
+async def broadcast_timer_update(time_left):
+    """Send one timer tick to participants and admins concurrently, serialized once for every socket"""
+    text = encode_message({"type": "timer_update", "time_left": time_left})
+    await asyncio.gather(
+        participant_manager.broadcast_text(text),
+        admin_manager.broadcast_text(text),
+    )
+
+async def run_countdown(duration):
+    """Broadcast whole-second timer updates until a monotonic deadline passes.
+
+    Each sleep targets the next second boundary of the deadline, so broadcast
+    latency doesn't accumulate into drift, and seconds missed under load are
+    skipped rather than sent late.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + duration
+    last_sent = None
+    while True:
+        remaining = max(0, math.ceil(deadline - loop.time()))
+        if remaining != last_sent:
+            # Send timer updates to both participants and admins
+            await broadcast_timer_update(remaining)
+            last_sent = remaining
+        if remaining == 0:
+            break
+        await asyncio.sleep(max(0.0, deadline - (remaining - 1) - loop.time()))
+
 async def start_question_timer():
     global question_timer
 
@@ -1417,29 +1544,7 @@ async def start_question_timer():
         global word_cloud_scored
         # Use 60 seconds for pictionary, 30 seconds for other questions
         time_left = 60 if current_question and current_question.type == "pictionary" else 30
-        # Send initial timer state
-        await participant_manager.broadcast({
-            "type": "timer_update",
-            "time_left": time_left
-        })
-        await admin_manager.broadcast({
-            "type": "timer_update",
-            "time_left": time_left
-        })
-
-        # Count down
-        while time_left > 0:
-            await asyncio.sleep(1)
-            time_left -= 1
-            # Send timer updates to both participants and admins
-            await participant_manager.broadcast({
-                "type": "timer_update",
-                "time_left": time_left
-            })
-            await admin_manager.broadcast({
-                "type": "timer_update",
-                "time_left": time_left
-            })
+        await run_countdown(time_left)
         # Timer expired
         await admin_manager.broadcast({
             "type": "time_expired"
@@ -1459,30 +1564,7 @@ async def start_wof_timer(duration):
     global question_timer
 
     async def timer_task():
-        time_left = duration
-        # Send initial timer state
-        await participant_manager.broadcast({
-            "type": "timer_update",
-            "time_left": time_left
-        })
-        await admin_manager.broadcast({
-            "type": "timer_update",
-            "time_left": time_left
-        })
-
-        # Count down
-        while time_left > 0:
-            await asyncio.sleep(1)
-            time_left -= 1
-            # Send timer updates to both participants and admins
-            await participant_manager.broadcast({
-                "type": "timer_update",
-                "time_left": time_left
-            })
-            await admin_manager.broadcast({
-                "type": "timer_update",
-                "time_left": time_left
-            })
+        await run_countdown(duration)
         # Timer expired
         await admin_manager.broadcast({
             "type": "time_expired"
@@ -1494,59 +1576,79 @@ async def get_current_answers(db):
     if not current_question or not getattr(current_question, "id", None):
         return [], 0
 
-    answers = db.query(Answer, User).join(User).filter(
+    # Plain columns with the timestamp already formatted by SQLite: no ORM objects or datetimes per row
+    rows = await run_blocking(db.query(
+        User.name,
+        Answer.content,
+        Answer.is_correct,
+        Answer.score,
+        Answer.retry_count,
+        func.strftime("%Y-%m-%dT%H:%M:%f", Answer.timestamp)
+    ).join(User, User.id == Answer.user_id).filter(
         Answer.question_id == current_question.id
-    ).all()
-
-    correct_count = sum(1 for answer, _ in answers if answer.is_correct)
-
-    # Sort answers by score (descending) for ranking
-    answer_data = [{
-        "user": user.name,
-        "content": answer.content,
-        "correct": answer.is_correct,
-        "score": answer.score,
-        "retry_count": answer.retry_count,
-        "timestamp": answer.timestamp.isoformat() if answer.timestamp else None
-    } for answer, user in answers]
-
-    # Sort by score descending for question rankings
-    answer_data.sort(key=lambda x: x["score"], reverse=True)
+    ).order_by(Answer.score.desc(), Answer.id).all)  # Score descending for question rankings
+
+    # Count correct answers in the same pass that builds the payload
+    answer_data = []
+    correct_count = 0
+    for name, content, is_correct, score, retry_count, timestamp in rows:
+        if is_correct:
+            correct_count += 1
+        answer_data.append({
+            "user": name,
+            "content": content,
+            "correct": is_correct,
+            "score": score,
+            "retry_count": retry_count,
+            "timestamp": timestamp
+        })
 
     return answer_data, correct_count
 
 async def get_cumulative_scores(db):
     """Get cumulative scores for all users in the current game"""
+    global _leaderboard_lock
     if not current_game or current_game.id is None:
         return []
 
-    # Get all answers for the current game
-    answers = db.query(Answer, User).join(User).filter(
-        Answer.game_id == current_game.id
-    ).all()
-
-    # Aggregate scores by user
-    user_scores = {}
-    for answer, user in answers:
-        user_id = user.id
-        if user_id not in user_scores:
-            user_scores[user_id] = {
-                "user_id": user_id,
-                "user_name": user.name,
-                "total_score": 0,
-                "questions_answered": 0,
-                "correct_answers": 0
-            }
-        user_scores[user_id]["total_score"] += answer.score
-        user_scores[user_id]["questions_answered"] += 1
-        if answer.is_correct:
-            user_scores[user_id]["correct_answers"] += 1
-
-    # Convert to list and sort by total score descending
-    leaderboard = list(user_scores.values())
-    leaderboard.sort(key=lambda x: x["total_score"], reverse=True)
+    if _leaderboard_lock is None:
+        _leaderboard_lock = asyncio.Lock()
+    # Serialize recomputes so concurrent callers reuse one result instead of all querying
+    async with _leaderboard_lock:
+        cache = _leaderboard_cache
+        if (not cache["dirty"] and cache["game_id"] == current_game.id
+                and time.monotonic() - cache["ts"] < LEADERBOARD_CACHE_TTL):
+            return cache["data"]
+        # Clear the flag before querying so writes that land mid-query dirty it again
+        cache["dirty"] = False
+        try:
+            leaderboard = await _compute_cumulative_scores(db, current_game.id)
+        except Exception:
+            cache["dirty"] = True
+            raise
+        cache.update(game_id=current_game.id, data=leaderboard, ts=time.monotonic())
+        return leaderboard
+
+async def _compute_cumulative_scores(db, game_id):
+    # Aggregate per user in SQLite (uses ix_answers_game_user), already sorted by total score
+    total_score = func.coalesce(func.sum(Answer.score), 0).label("total_score")
+    rows = await run_blocking(db.query(
+        User.id,
+        User.name,
+        total_score,
+        func.count(Answer.id),
+        func.sum(case((Answer.is_correct, 1), else_=0))
+    ).join(Answer, Answer.user_id == User.id).filter(
+        Answer.game_id == game_id
+    ).group_by(User.id).order_by(total_score.desc(), User.id).all)
 
-    return leaderboard
+    return [{
+        "user_id": user_id,
+        "user_name": user_name,
+        "total_score": total,
+        "questions_answered": answered,
+        "correct_answers": correct or 0
+    } for user_id, user_name, total, answered, correct in rows]
 
 # Helper to do word cloud scoring and reveal, idempotent
 async def score_word_cloud_and_reveal(db, admin_connection_id=None):
@@ -1564,8 +1666,8 @@ async def score_word_cloud_and_reveal(db, admin_connection_id=None):
     if not question_id or not game_id:
         return
 
-    # Fetch all answers
-    answer_objs = db.query(Answer).filter(
+    # Fetch all answers, with their users in the same query (session_id is needed per answer below)
+    answer_objs = db.query(Answer).options(joinedload(Answer.user)).filter(
         Answer.question_id == question_id,
         Answer.game_id == game_id
     ).all()
@@ -1573,47 +1675,57 @@ async def score_word_cloud_and_reveal(db, admin_connection_id=None):
     answers = [(ans.user_id, ans.content.strip()) for ans in answer_objs if ans.content and ans.content.strip()]
 
     cluster_map, answer_to_cluster = cluster_word_cloud_answers(answers)
+    cluster_sizes = {cid: len(cluster["users"]) for cid, cluster in cluster_map.items()}
+    cluster_reps = {cid: cluster["rep"] for cid, cluster in cluster_map.items()}
     total_participants = len(answers)
     for ans in answer_objs:
         # No scoring for word clouds - they are warmup questions
         ans.score = 0
         ans.is_correct = False
+    # Snapshot what the rest of the reveal needs: commit expires ORM attributes (and the
+    # eager-loaded user) on default sessions, which would reload every answer row one by one
+    recipients = [(ans.user_id, ans.content, ans.retry_count, ans.user.session_id) for ans in answer_objs]
     db.commit()
+    mark_answers_changed()
     # Prepare for admin word cloud - show individual user counts per word
-    # Count occurrences of each word (not cluster sizes)
-    word_counts = {}
-    for ans in answer_objs:
-        word = ans.content.strip().lower()
-        if word:
-            word_counts[word] = word_counts.get(word, 0) + 1
+    # Count occurrences of each word (not cluster sizes), aggregated by SQLite on the normalized column
+    word_counts = db.query(Answer.content_norm, func.count()).filter(
+        Answer.question_id == question_id,
+        Answer.game_id == game_id,
+        Answer.content_norm != ""
+    ).group_by(Answer.content_norm).order_by(func.count().desc()).all()
 
+    # Already sorted by count descending for display
     word_cloud = [
         {
-            "text": word,
+            "text": text,
             "size": count,  # Individual user count, not cluster size
-            "answers": [word]  # Just the word itself
+            "answers": [text]  # Just the word itself
         }
-        for word, count in word_counts.items()
+        for text, count in word_counts
     ]
-    # Sort by count descending for display
-    word_cloud.sort(key=lambda x: x["size"], reverse=True)
-    for ans in answer_objs:
-        cluster_id = answer_to_cluster.get(ans.user_id)
-        cluster_size = len(cluster_map[cluster_id]["users"]) if cluster_id is not None else 1
-        await participant_manager.send_personal_message(
+    # Cumulative score per user in one aggregate query instead of one query per answer
+    total_scores = dict(db.query(Answer.user_id, func.sum(Answer.score)).filter(
+        Answer.game_id == game_id
+    ).group_by(Answer.user_id).all())
+    # Send every participant's feedback concurrently rather than one socket at a time
+    await asyncio.gather(*(
+        participant_manager.send_personal_message(
             {
                 "type": "personal_feedback",
                 "correct": False,
-                "score": ans.score,
-                "total_score": sum(a.score for a in db.query(Answer).filter(Answer.user_id == ans.user_id, Answer.game_id == game_id).all()),
-                "retry_count": ans.retry_count,
+                "score": 0,
+                "total_score": total_scores.get(user_id) or 0,
+                "retry_count": retry_count,
                 "allow_multiple": False,
-                "cluster_size": cluster_size,
-                "cluster_rep": cluster_map[cluster_id]["rep"] if cluster_id is not None else ans.content,
+                "cluster_size": cluster_sizes.get(answer_to_cluster.get(user_id), 1),
+                "cluster_rep": cluster_reps.get(answer_to_cluster.get(user_id), content),
                 "scoring_status": "complete"
             },
-            ans.user.session_id
+            session_id
         )
+        for user_id, content, retry_count, session_id in recipients
+    ), return_exceptions=True)
     # Broadcast word cloud to admin only
     reveal_payload = {
         "type": "word_cloud_revealed",
@@ -1629,28 +1741,52 @@ async def score_word_cloud_and_reveal(db, admin_connection_id=None):
 
 # Periodic status updates for admin
 async def send_admin_status_updates():
+    last_state = None
+    last_sent = 0.0
+    # Reused every tick; safe because it is serialized immediately and never handed out
+    status_update = {
+        "type": "status_update",
+        "participant_count": 0,
+        "quiz_active": False,
+        "current_question": None,
+        "question_type": None,
+        "total_answered": 0,
+        "correct_answers": 0,
+        "leaderboard": []
+    }
     while True:
         try:
-            db = SessionLocal()
-            try:
-                answers, correct_count = await get_current_answers(db)
-                leaderboard = await get_cumulative_scores(db)
-                total_answered = len(answers)
-                # Send participant count, quiz status, total answered, correct answer count, and leaderboard
-                status_update = {
-                    "type": "status_update",
-                    "participant_count": participant_manager.get_participant_count(),
-                    "quiz_active": current_game is not None and current_game.status == "active",
-                    "current_question": current_question.content if current_question else None,
-                    "question_type": current_question.type if current_question else None,
-                    "total_answered": total_answered,
-                    "correct_answers": correct_count,
-                    "leaderboard": leaderboard
-                }
-
-                await admin_manager.broadcast(status_update)
-            finally:
-                db.close()
+            # Everything the status payload depends on; when none of it changed since the
+            # last broadcast, skip the answer/leaderboard queries for this tick. Writes from
+            # outside this process don't bump answers_revision, so still refresh once per
+            # LEADERBOARD_CACHE_TTL (a leaderboard cached at the last send has lapsed by then)
+            state = (
+                answers_revision,
+                participant_manager.get_participant_count(),
+                tuple(admin_manager.active_connections),  # A newly connected admin needs a fresh status
+                game_active,
+                tuple(current_question_snapshot.values()),
+            )
+            now = time.monotonic()
+            if admin_manager.has_connections() and (state != last_state or now - last_sent >= LEADERBOARD_CACHE_TTL):
+                db = SessionLocal()
+                try:
+                    answers, correct_count = await get_current_answers(db)
+                    leaderboard = await get_cumulative_scores(db)
+                    # Send participant count, quiz status, total answered, correct answer count, and leaderboard
+                    status_update["participant_count"] = participant_manager.get_participant_count()
+                    status_update["quiz_active"] = game_active
+                    status_update["current_question"] = current_question_snapshot["content"]
+                    status_update["question_type"] = current_question_snapshot["type"]
+                    status_update["total_answered"] = len(answers)
+                    status_update["correct_answers"] = correct_count
+                    status_update["leaderboard"] = leaderboard
+
+                    await admin_manager.broadcast_text(encode_message(status_update))
+                    last_state = state
+                    last_sent = now
+                finally:
+                    db.close()
         except Exception as e:
             print(f"Error sending status update: {e}")
 
@@ -1,19 +1,40 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, Boolean, DateTime, ForeignKey, text
+from sqlalchemy import create_engine, event, inspect, Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Index, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from datetime import datetime
+import hashlib
+import json
+import os
+
+# SQLite database URL - can be changed dynamically; TRIVIA_DATABASE_URL overrides the
+# default (tests point it at a temporary file so importing models leaves local data alone)
+SQLALCHEMY_DATABASE_URL = os.environ.get("TRIVIA_DATABASE_URL", "sqlite:///./database/warmup_trivia.db")
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune each new SQLite connection for many concurrent websocket writers"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")  # Readers no longer block the writer
+    cursor.execute("PRAGMA synchronous=NORMAL")  # Safe with WAL, avoids an fsync per commit
+    cursor.execute("PRAGMA busy_timeout=5000")  # Wait for a competing writer instead of failing with "database is locked"
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=134217728")  # 128 MB
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MB
+    cursor.close()
+
+def make_engine(url: str):
+    """Create a pooled SQLite engine with the WAL pragmas applied to every connection"""
+    new_engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False},  # Only for SQLite
+        pool_size=150,  # Base pool: 150 connections for 150 users
+        max_overflow=50,  # Overflow: +50 more = 200 total (extra safe)
+        pool_timeout=60,  # Wait up to 60s for connection
+        pool_recycle=3600  # Recycle connections every hour
+    )
+    event.listen(new_engine, "connect", _set_sqlite_pragmas)
+    return new_engine
 
-# SQLite database URL - can be changed dynamically
-SQLALCHEMY_DATABASE_URL = "sqlite:///./database/warmup_trivia.db"
-
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},  # Only for SQLite
-    pool_size=150,  # Base pool: 150 connections for 150 users
-    max_overflow=50,  # Overflow: +50 more = 200 total (extra safe)
-    pool_timeout=60,  # Wait up to 60s for connection
-    pool_recycle=3600  # Recycle connections every hour
-)
+engine = make_engine(SQLALCHEMY_DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Function to switch database dynamically
@@ -25,14 +46,7 @@ def switch_database(new_db_path: str):
     new_url = f"sqlite:///./{new_db_path}"
 
     # Create new engine and session factory
-    new_engine = create_engine(
-        new_url,
-        connect_args={"check_same_thread": False},
-        pool_size=150,  # Same pool settings for switched databases
-        max_overflow=50,
-        pool_timeout=60,
-        pool_recycle=3600
-    )
+    new_engine = make_engine(new_url)  # Same pool settings and pragmas for switched databases
 
     # Test connection
     try:
@@ -49,6 +63,8 @@ def switch_database(new_db_path: str):
 
     # Create tables if they don't exist
     Base.metadata.create_all(bind=engine)
+    add_missing_columns(engine)
+    create_missing_indexes(engine)
 
     return new_db_path
 
@@ -74,11 +90,40 @@ class Question(Base):
     answers = Column(Text)  # JSON string for multiple choice options
     correct_answer = Column(Text, nullable=False)
     allow_multiple = Column(Boolean, default=True)
-    order = Column(Integer, nullable=False, default=0)  # <-- Added for question reordering
+    order = Column(Integer, nullable=False, default=0, index=True)  # <-- Added for question reordering
+    # question_content_hash() of type/content/correct_answer/answers, for import deduplication.
+    # Not unique: duplicate questions are allowed (admin panel, imports with duplicates kept)
+    content_hash = Column(String(32), index=True)
     # Optional hidden prompt for pictionary questions
     # (removed – pictionary now uses correct_answer as the hint)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+def question_content_hash(question_type, content, correct_answer, answers=None) -> str:
+    """128-bit BLAKE2b hex digest identifying a question; answers (the option list) are order-insensitive"""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(question_type).encode('utf-8'))
+    for part in (content, correct_answer, *sorted(answers or ())):
+        h.update(b"|")
+        h.update(str(part).encode('utf-8'))
+    return h.hexdigest()
+
+def _parse_answers(answers):
+    """Decode a stored Question.answers JSON string, tolerating empty or malformed values"""
+    if not answers:
+        return None
+    try:
+        return json.loads(answers)
+    except ValueError:
+        return None
+
+def _set_question_content_hash(mapper, connection, target):
+    target.content_hash = question_content_hash(
+        target.type, target.content, target.correct_answer, _parse_answers(target.answers)
+    )
+
+event.listen(Question, "before_insert", _set_question_content_hash)
+event.listen(Question, "before_update", _set_question_content_hash)
+
 class Game(Base):
     """Game session model"""
     __tablename__ = "games"
@@ -91,6 +136,10 @@ class Game(Base):
 
     current_question = relationship("Question")
 
+def normalize_answer_content(content) -> str:
+    """Canonical form of an answer used for grouping (word cloud counts)"""
+    return (content or "").strip().lower()
+
 class Answer(Base):
     """Answer submission model"""
     __tablename__ = "answers"
@@ -100,6 +149,9 @@ class Answer(Base):
     question_id = Column(Integer, ForeignKey("questions.id"), nullable=False)
     game_id = Column(Integer, ForeignKey("games.id"), nullable=False)
     content = Column(Text, nullable=False)
+    # normalize_answer_content(content), stored on write so aggregation doesn't LOWER/TRIM every row;
+    # the default covers inserts, code that changes content must set it as well
+    content_norm = Column(Text, default=lambda ctx: normalize_answer_content(ctx.get_current_parameters().get("content")))
     is_correct = Column(Boolean, default=False)
     score = Column(Integer, default=0)  # Time-based score (seconds remaining if correct, 0 if wrong)
     retry_count = Column(Integer, default=1)
@@ -109,5 +161,61 @@ class Answer(Base):
     question = relationship("Question")
     game = relationship("Game")
 
+    __table_args__ = (
+        Index("ix_answers_game_user", "game_id", "user_id"),  # Per-user totals within a game
+        Index("ix_answers_q_g", "question_id", "game_id"),  # Answers to the current question
+    )
+
+# Bound parameters per statement; SQLite builds before 3.32 cap it at 999
+SQLITE_MAX_VARIABLES = 999
+
+def bulk_insert(session, table, rows):
+    """
+    Insert many rows as multi-row INSERT ... VALUES (...), (...) statements.
+
+    Rows (dicts with the same keys) are grouped so each statement stays under
+    SQLITE_MAX_VARIABLES; column defaults still apply to every row.
+    """
+    if not rows:
+        return
+    chunk_size = max(1, SQLITE_MAX_VARIABLES // len(rows[0]))
+    for start in range(0, len(rows), chunk_size):
+        session.execute(table.insert().values(rows[start:start + chunk_size]))
+
+def create_missing_indexes(bind):
+    """Create indexes added after a database file was first built (create_all skips existing tables)"""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
+
+def add_missing_columns(bind):
+    """Add and backfill columns introduced after a database file was first built (create_all skips existing tables)"""
+    inspector = inspect(bind)
+    answer_columns = {column["name"] for column in inspector.get_columns("answers")}
+    question_columns = {column["name"] for column in inspector.get_columns("questions")}
+
+    with bind.begin() as conn:
+        if "content_norm" not in answer_columns:
+            conn.execute(text("ALTER TABLE answers ADD COLUMN content_norm TEXT"))
+            # Backfilled with normalize_answer_content, not SQL LOWER(TRIM()), which only trims spaces
+            # and folds ASCII and so would group older answers apart from new ones
+            rows = conn.execute(text("SELECT id, content FROM answers")).all()
+            if rows:
+                conn.execute(text("UPDATE answers SET content_norm = :content_norm WHERE id = :id"), [
+                    {"id": row.id, "content_norm": normalize_answer_content(row.content)}
+                    for row in rows
+                ])
+
+        if "content_hash" not in question_columns:
+            conn.execute(text("ALTER TABLE questions ADD COLUMN content_hash VARCHAR(32)"))
+            rows = conn.execute(text("SELECT id, type, content, correct_answer, answers FROM questions")).all()
+            if rows:
+                conn.execute(text("UPDATE questions SET content_hash = :content_hash WHERE id = :id"), [
+                    {"id": row.id, "content_hash": question_content_hash(row.type, row.content, row.correct_answer, _parse_answers(row.answers))}
+                    for row in rows
+                ])
+
 # Create tables
 Base.metadata.create_all(bind=engine)
+add_missing_columns(engine)
+create_missing_indexes(engine)
@@ -29,33 +29,45 @@ def main():
         conn.close()
         return
 
-    # 1. Create new table without hidden_prompt
-    cur.execute("""
-        CREATE TABLE questions_new (
-            id INTEGER PRIMARY KEY,
-            type TEXT NOT NULL,
-            content TEXT NOT NULL,
-            answers TEXT,
-            correct_answer TEXT NOT NULL,
-            category TEXT NOT NULL,
-            allow_multiple BOOLEAN DEFAULT 1,
-            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-
-    # 2. Copy data (ignore hidden_prompt)
-    cur.execute("""
-        INSERT INTO questions_new (id, type, content, answers, correct_answer, category, allow_multiple, created_at)
-        SELECT id, type, content, answers, correct_answer, category, allow_multiple, created_at
-        FROM questions
-    """)
-
-    # 3. Drop old table and rename new one
-    cur.execute("DROP TABLE questions")
-    cur.execute("ALTER TABLE questions_new RENAME TO questions")
-
-    conn.commit()
-    conn.close()
+    # Run the whole copy/drop/rename as one explicit write transaction so it
+    # commits (and syncs) once; WAL with synchronous=NORMAL avoids a full
+    # fsync per statement. Autocommit mode keeps sqlite3 from issuing its own BEGIN.
+    conn.isolation_level = None
+    cur.execute("PRAGMA journal_mode=WAL")
+    cur.execute("PRAGMA synchronous=NORMAL")
+    cur.execute("BEGIN IMMEDIATE")
+    try:
+        # 1. Create new table without hidden_prompt
+        cur.execute("""
+            CREATE TABLE questions_new (
+                id INTEGER PRIMARY KEY,
+                type TEXT NOT NULL,
+                content TEXT NOT NULL,
+                answers TEXT,
+                correct_answer TEXT NOT NULL,
+                category TEXT NOT NULL,
+                allow_multiple BOOLEAN DEFAULT 1,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+        # 2. Copy data (ignore hidden_prompt)
+        cur.execute("""
+            INSERT INTO questions_new (id, type, content, answers, correct_answer, category, allow_multiple, created_at)
+            SELECT id, type, content, answers, correct_answer, category, allow_multiple, created_at
+            FROM questions
+        """)
+
+        # 3. Drop old table and rename new one
+        cur.execute("DROP TABLE questions")
+        cur.execute("ALTER TABLE questions_new RENAME TO questions")
+        cur.execute("COMMIT")
+    except Exception:
+        cur.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+
     print("Migration completed: `hidden_prompt` column removed from `questions` table.")
 
 if __name__ == "__main__":
@@ -30,18 +30,51 @@ sys.path.insert(0, str(backend_path))
 from models import SessionLocal, Question
 
 
+def build_export_record(question: Question) -> Dict[str, Any]:
+    """Convert a Question row into its export dictionary"""
+    question_data = {
+        "id": question.id,
+        "type": question.type,
+        "content": question.content,
+        "correct_answer": question.correct_answer,
+        "allow_multiple": question.allow_multiple,
+        "order": getattr(question, 'order', 0),
+        "created_at": question.created_at.isoformat() if question.created_at else None
+    }
+
+    # Only include answers for question types that use them (parse the stored JSON only for those rows)
+    if question.type in ["multiple_choice", "multiplechoice", "mcq"]:
+        answers = None
+        if question.answers:
+            try:
+                answers = json.loads(question.answers)
+            except json.JSONDecodeError as e:
+                print(f"⚠️  Warning: Invalid JSON in answers for question ID {question.id}: {e}")
+                answers = []
+        question_data["answers"] = answers
+
+    return question_data
+
+
 def export_questions_to_json(
     output_file: str,
     type_filter: Optional[str] = None,
-    pretty_print: bool = True
+    pretty_print: bool = True,
+    json_lines: bool = False,
+    batch_size: int = 1000
 ) -> Dict[str, Any]:
     """
     Export questions from database to JSON file.
 
+    Rows are streamed from the database in batches and written to the file
+    as they are converted, so memory use does not grow with the table size.
+
     Args:
         output_file: Path to output JSON file
         type_filter: Optional question type filter
-        pretty_print: Whether to pretty-print JSON
+        pretty_print: Whether to pretty-print JSON (ignored for JSON Lines)
+        json_lines: Write one JSON object per line instead of a JSON array
+        batch_size: Number of rows fetched from the database per batch
 
     Returns:
         Dict with export statistics
@@ -50,6 +83,7 @@ def export_questions_to_json(
     print("=" * 50)
 
     db = SessionLocal()
+    f = None
     try:
         # Build query with optional filters
         query = db.query(Question)
@@ -59,55 +93,46 @@ def export_questions_to_json(
             print(f"🔍 Filtering by type: {type_filter}")
 
         # Order by creation date for consistency
-        questions = query.order_by(Question.created_at).all()
+        query = query.order_by(Question.created_at).yield_per(batch_size)
 
-        if not questions:
-            print("⚠️  No questions found matching the criteria")
-            return {"total_exported": 0, "types": {}}
-
-        # Convert questions to export format
-        export_data = []
+        total_exported = 0
         types_count = {}
+        separator = "\n" if json_lines else ",\n"
 
-        for question in questions:
-            # Parse answers JSON if it exists
-            answers = None
-            if question.answers:
-                try:
-                    answers = json.loads(question.answers)
-                except json.JSONDecodeError as e:
-                    print(f"⚠️  Warning: Invalid JSON in answers for question ID {question.id}: {e}")
-                    answers = []
-
-            # Create export record
-            question_data = {
-                "id": question.id,
-                "type": question.type,
-                "content": question.content,
-                "correct_answer": question.correct_answer,
-                "allow_multiple": question.allow_multiple,
-                "order": getattr(question, 'order', 0),
-                "created_at": question.created_at.isoformat() if question.created_at else None
-            }
-
-            # Only include answers for question types that use them
-            if question.type in ["multiple_choice", "multiplechoice", "mcq"]:
-                question_data["answers"] = answers
-
-            export_data.append(question_data)
-
-            # Update statistics
-            types_count[question.type] = types_count.get(question.type, 0) + 1
+        for question in query:
+            question_data = build_export_record(question)
 
-        # Write to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            if pretty_print:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            if json_lines or not pretty_print:
+                text = json.dumps(question_data, ensure_ascii=False)
             else:
-                json.dump(export_data, f, ensure_ascii=False)
+                # Indent each record one level so the array matches json.dump(..., indent=2)
+                text = "  " + json.dumps(question_data, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+
+            if f is None:
+                # Open lazily so an empty result does not leave an empty file behind
+                f = open(output_file, 'w', encoding='utf-8')
+                if not json_lines:
+                    f.write("[\n" if pretty_print else "[")
+            else:
+                f.write(separator if (json_lines or pretty_print) else ", ")
+            f.write(text)
+
+            total_exported += 1
+            types_count[question.type] = types_count.get(question.type, 0) + 1
+
+        if f is None:
+            print("⚠️  No questions found matching the criteria")
+            return {"total_exported": 0, "types": {}}
+
+        if json_lines:
+            f.write("\n")
+        else:
+            f.write("\n]" if pretty_print else "]")
+        f.close()
+        f = None
 
         # Print statistics
-        print(f"✅ Successfully exported {len(export_data)} questions to {output_file}")
+        print(f"✅ Successfully exported {total_exported} questions to {output_file}")
         print("\n📊 Export Statistics:")
         print(f"   🔍 Types: {dict(sorted(types_count.items()))}")
 
@@ -116,7 +141,7 @@ def export_questions_to_json(
         print(f"   📁 File size: {file_size:,} bytes")
 
         return {
-            "total_exported": len(export_data),
+            "total_exported": total_exported,
             "types": types_count,
             "file_size": file_size,
             "output_file": output_file
@@ -126,6 +151,8 @@ def export_questions_to_json(
         print(f"❌ Error during export: {e}")
         raise
     finally:
+        if f is not None:
+            f.close()
         db.close()
 
 
@@ -139,6 +166,7 @@ Examples:
   uv run python export_questions.py questions.json
   uv run python export_questions.py --category geography questions_geo.json
   uv run python export_questions.py --type multiple_choice --compact questions_mc.json
+  uv run python export_questions.py --jsonl questions.jsonl
         """
     )
 
@@ -158,13 +186,20 @@ Examples:
         help="Use compact JSON format (no pretty printing)"
     )
 
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Write JSON Lines (one question per line) instead of a JSON array"
+    )
+
     args = parser.parse_args()
 
     try:
         export_questions_to_json(
             output_file=args.output_file,
             type_filter=args.type,
-            pretty_print=not args.compact
+            pretty_print=not args.compact,
+            json_lines=args.jsonl
         )
     except KeyboardInterrupt:
         print("\n⏹️  Export cancelled by user")
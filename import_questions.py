@@ -23,13 +23,24 @@ import argparse
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
-import hashlib
+
+try:
+    import ijson  # Optional: stream large question files instead of loading them whole
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # Optional: faster whole-file parse when ijson is not installed
+except ImportError:
+    orjson = None
 
 # Add backend directory to Python path
 backend_path = Path(__file__).parent / "backend"
 sys.path.insert(0, str(backend_path))
 
-from models import SessionLocal, Question
+from sqlalchemy import delete, func
+
+from models import SessionLocal, Question, bulk_insert, question_content_hash, SQLITE_MAX_VARIABLES
 
 # Allowed question types (must match backend validation)
 ALLOWED_QUESTION_TYPES = {
@@ -40,6 +51,16 @@ ALLOWED_QUESTION_TYPES = {
     "wheel_of_fortune"
 }
 
+# For error messages
+_ALLOWED_TYPES_SORTED = sorted(ALLOWED_QUESTION_TYPES)
+
+# Question types that carry an options list
+MULTIPLE_CHOICE_TYPES = frozenset({"multiple_choice", "multiplechoice", "mcq"})
+
+# Inserts at least this large drop the questions indexes and rebuild them afterwards,
+# one index build being cheaper than maintaining the B-trees row by row
+DEFER_INDEXES_MIN_ROWS = 1000
+
 # Legacy type mappings for backward compatibility
 TYPE_MAPPINGS = {
     "fill_blank": "fill_in_the_blank",
@@ -49,70 +70,123 @@ TYPE_MAPPINGS = {
 }
 
 
-def validate_question_data(question_data: Dict[str, Any]) -> Tuple[bool, List[str]]:
+def validate_question_data(question_data: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
     """
     Validate a single question's data structure.
 
+    The input dict is left untouched; the returned copy has the legacy type
+    mapped to its current name and allow_multiple filled in.
+
     Args:
         question_data: Question data dictionary
 
     Returns:
-        Tuple of (is_valid, error_messages)
+        Tuple of (normalized_question, error_messages)
     """
-    errors = []
-
-    # Required fields
-    required_fields = ["type", "content", "correct_answer"]
-    for field in required_fields:
-        if field not in question_data or not question_data[field]:
-            errors.append(f"Missing or empty required field: {field}")
-
+    # Required fields (reported together, then stop: later checks depend on them)
+    errors = [
+        f"Missing or empty required field: {field}"
+        for field in ("type", "content", "correct_answer")
+        if not question_data.get(field)
+    ]
     if errors:
-        return False, errors
+        return question_data, errors
 
     # Validate question type
-    question_type = question_data.get("type", "").strip()
+    question_type = question_data["type"].strip()
     if question_type not in ALLOWED_QUESTION_TYPES:
         # Try legacy mapping
-        if question_type in TYPE_MAPPINGS:
-            question_data["type"] = TYPE_MAPPINGS[question_type]
+        mapped_type = TYPE_MAPPINGS.get(question_type)
+        if mapped_type is not None:
+            question_type = mapped_type
         else:
-            errors.append(f"Invalid question type '{question_type}'. Must be one of: {sorted(ALLOWED_QUESTION_TYPES)}")
+            errors.append(f"Invalid question type '{question_type}'. Must be one of: {_ALLOWED_TYPES_SORTED}")
 
     # Validate type-specific requirements
-    if question_data["type"] in ["multiple_choice", "multiplechoice", "mcq"]:
-        if "answers" not in question_data or not isinstance(question_data["answers"], list):
+    if question_type in MULTIPLE_CHOICE_TYPES:
+        answers = question_data.get("answers")
+        if not isinstance(answers, list):
             errors.append("Multiple choice questions must have an 'answers' array")
-        elif len(question_data["answers"]) < 2:
+        elif len(answers) < 2:
             errors.append("Multiple choice questions must have at least 2 answer options")
-        elif question_data["correct_answer"] not in question_data["answers"]:
+        elif question_data["correct_answer"] not in answers:
             errors.append("Correct answer must be one of the provided answer options")
 
     # Validate allow_multiple (default to True for backward compatibility)
-    if "allow_multiple" not in question_data:
-        question_data["allow_multiple"] = True
-    elif not isinstance(question_data["allow_multiple"], bool):
+    allow_multiple = question_data.get("allow_multiple", True)
+    if not isinstance(allow_multiple, bool):
         errors.append("allow_multiple must be a boolean value")
 
-    return len(errors) == 0, errors
+    return {**question_data, "type": question_type, "allow_multiple": allow_multiple}, errors
+
+
+def iter_questions_json(input_file: str):
+    """
+    Yield question dicts from a JSON array file.
+
+    Streams items with ijson when it is installed, so validation starts
+    before the whole file is parsed; otherwise parses the whole file with
+    orjson if available, or json.load.
+    """
+    if ijson is None:
+        try:
+            if orjson is not None:
+                import_data = orjson.loads(Path(input_file).read_bytes())
+            else:
+                with open(input_file, 'r', encoding='utf-8') as f:
+                    import_data = json.load(f)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Input file not found: {input_file}")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in input file: {e}")
+
+        if not isinstance(import_data, list):
+            raise ValueError("Input file must contain a JSON array of questions")
+        yield from import_data
+        return
+
+    try:
+        f = open(input_file, 'rb')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Input file not found: {input_file}")
+
+    with f:
+        # ijson would silently yield nothing for a top-level object, so check for the array up front
+        first = f.read(1)
+        while first and first.isspace():
+            first = f.read(1)
+        if first != b"[":
+            raise ValueError("Input file must contain a JSON array of questions")
+        f.seek(0)
+
+        try:
+            yield from ijson.items(f, 'item', use_float=True)
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON in input file: {e}")
 
 
 def calculate_question_hash(question_data: Dict[str, Any]) -> str:
     """
     Calculate a hash for question deduplication based on content and answer.
 
+    The digest is cached on the dict under "_hash", so hashing the same
+    question again (in-file dedup, then database dedup) is a lookup.
+
     Args:
         question_data: Question data dictionary
 
     Returns:
-        SHA256 hash string
+        BLAKE2b (128-bit) hex digest string
     """
-    # Create a normalized string for hashing
-    hash_content = f"{question_data['type']}|{question_data['content']}|{question_data['correct_answer']}"
-    if question_data.get("answers"):
-        hash_content += f"|{'|'.join(sorted(question_data['answers']))}"
+    cached = question_data.get("_hash")
+    if cached is not None:
+        return cached
 
-    return hashlib.sha256(hash_content.encode('utf-8')).hexdigest()
+    # Same digest as the stored Question.content_hash column
+    question_data["_hash"] = digest = question_content_hash(
+        question_data['type'], question_data['content'], question_data['correct_answer'], question_data.get("answers")
+    )
+    return digest
 
 
 def import_questions_from_json(
@@ -142,29 +216,17 @@ def import_questions_from_json(
     if dry_run:
         print("🔍 DRY RUN MODE - No changes will be made to database")
 
-    # Read and parse JSON file
-    try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            import_data = json.load(f)
-    except FileNotFoundError:
-        raise FileNotFoundError(f"Input file not found: {input_file}")
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in input file: {e}")
-
-    if not isinstance(import_data, list):
-        raise ValueError("Input file must contain a JSON array of questions")
-
-    print(f"📁 Reading {len(import_data)} questions from {input_file}")
-
-    # Validate all questions first
+    # Validate all questions first, as they are read from the file
     valid_questions = []
     validation_errors = []
     question_hashes = set()
+    total_read = 0
 
-    for i, question_data in enumerate(import_data, 1):
-        is_valid, errors = validate_question_data(question_data)
+    for i, question_data in enumerate(iter_questions_json(input_file), 1):
+        total_read = i
+        normalized, errors = validate_question_data(question_data)
 
-        if not is_valid:
+        if errors:
             validation_errors.append({
                 "question_index": i,
                 "data": question_data,
@@ -172,15 +234,20 @@ def import_questions_from_json(
             })
             continue
 
-        # Check for duplicates within import file
-        question_hash = calculate_question_hash(question_data)
-        if question_hash in question_hashes:
-            if skip_duplicates:
+        # Check for duplicates within import file. The digest is cached on the dict and
+        # reused for the database check and the stored content_hash, so this costs no extra hashing
+        if skip_duplicates:
+            question_hash = calculate_question_hash(normalized)
+            if question_hash in question_hashes:
                 print(f"⚠️  Skipping duplicate question {i} (same content as previous)")
                 continue
+            question_hashes.add(question_hash)
+
+        # Serialize the options once, for whichever insert/update path uses them
+        normalized["_answers_json"] = json.dumps(normalized["answers"]) if normalized.get("answers") else None
+        valid_questions.append((i, normalized))
 
-        question_hashes.add(question_hash)
-        valid_questions.append((i, question_data))
+    print(f"📁 Read {total_read} questions from {input_file}")
 
     if validation_errors:
         print(f"❌ Found {len(validation_errors)} validation errors:")
@@ -218,75 +285,100 @@ def import_questions_from_json(
 
         # Drop existing questions if requested
         if drop_existing:
-            existing_count = db.query(Question).count()
-            if existing_count > 0:
-                print(f"🗑️  Dropping {existing_count} existing questions...")
-                db.query(Question).delete()
-                db.commit()
-                dropped = existing_count
+            # Plain DELETE without session synchronization; its rowcount saves a separate COUNT
+            dropped = db.execute(delete(Question).execution_options(synchronize_session=False)).rowcount
+            db.commit()
+            if dropped > 0:
                 print(f"✅ Dropped {dropped} existing questions")
 
-        # Get existing question hashes for deduplication (only if not dropping all)
+        # Get existing question hashes for deduplication (only if not dropping all);
+        # only the incoming hashes are looked up, via the content_hash index, so the
+        # cost follows the file size rather than the table size
         existing_hashes = {}
         if not drop_existing and (skip_duplicates or update_existing):
-            existing_questions = db.query(Question).all()
-            for eq in existing_questions:
-                # Recreate hash for existing question
-                hash_data = {
-                    "type": eq.type,
-                    "content": eq.content,
-                    "correct_answer": eq.correct_answer,
-                    "answers": json.loads(eq.answers) if eq.answers else None
-                }
-                existing_hashes[calculate_question_hash(hash_data)] = eq
+            incoming_hashes = list({calculate_question_hash(q) for _, q in valid_questions})
+            for start in range(0, len(incoming_hashes), SQLITE_MAX_VARIABLES):
+                existing_hashes.update(
+                    db.query(Question.content_hash, Question.id)
+                    .filter(Question.content_hash.in_(incoming_hashes[start:start + SQLITE_MAX_VARIABLES]))
+                    .all()
+                )
 
         # Determine next order value
-        max_order = db.query(Question).count()  # Use count as next order
+        # Next free order value (the row count collides once questions have been deleted),
+        # fetched together with the current count so the final total needs no second scan
+        existing_count, max_order = db.query(
+            func.count(Question.id), func.coalesce(func.max(Question.order), -1) + 1
+        ).one()
+
+        # New questions are collected and inserted with a few multi-row INSERT statements,
+        # updates are applied together as executemany UPDATEs keyed by id
+        new_rows = []
+        update_rows = []
 
         for original_index, question_data in valid_questions:
             question_hash = calculate_question_hash(question_data)
 
             # Check for existing question
-            existing_question = existing_hashes.get(question_hash)
-            if existing_question:
+            existing_id = existing_hashes.get(question_hash)
+            if existing_id is not None:
                 if skip_duplicates:
                     print(f"⏭️  Skipping duplicate question {original_index} (already exists)")
                     skipped += 1
                     continue
                 elif update_existing:
-                    # Update existing question
-                    existing_question.type = question_data["type"]
-                    existing_question.content = question_data["content"]
-                    existing_question.correct_answer = question_data["correct_answer"]
-                    existing_question.allow_multiple = question_data["allow_multiple"]
-
-                    if question_data["type"] in ["multiple_choice", "multiplechoice", "mcq"]:
-                        existing_question.answers = json.dumps(question_data["answers"])
-                    else:
-                        existing_question.answers = None
+                    # Update existing question in place, without loading it
+                    update_row = {
+                        "id": existing_id,
+                        "type": question_data["type"],
+                        "content": question_data["content"],
+                        "correct_answer": question_data["correct_answer"],
+                        "allow_multiple": question_data["allow_multiple"],
+                        "answers": question_data["_answers_json"] if question_data["type"] in MULTIPLE_CHOICE_TYPES else None,
+                        "content_hash": question_hash  # Bulk updates skip the ORM event that fills it
+                    }
 
                     if preserve_order and "order" in question_data:
-                        existing_question.order = question_data["order"]
+                        update_row["order"] = question_data["order"]
 
+                    update_rows.append(update_row)
                     updated += 1
                     continue
 
             # Create new question
-            new_question = Question(
-                type=question_data["type"],
-                content=question_data["content"],
-                correct_answer=question_data["correct_answer"],
-                allow_multiple=question_data["allow_multiple"],
-                answers=json.dumps(question_data["answers"]) if question_data.get("answers") else None,
-                order=question_data.get("order", max_order + imported) if preserve_order else max_order + imported
-            )
-
-            db.add(new_question)
+            new_rows.append({
+                "type": question_data["type"],
+                "content": question_data["content"],
+                "correct_answer": question_data["correct_answer"],
+                "allow_multiple": question_data["allow_multiple"],
+                "answers": question_data["_answers_json"],
+                "order": question_data.get("order", max_order + imported) if preserve_order else max_order + imported,
+                "content_hash": question_hash  # Core inserts skip the ORM event that fills it
+            })
             imported += 1
 
-            if imported % 10 == 0:
-                print(f"  ✓ Imported {imported} questions...")
-
+        # Into an emptied table (or for a large file), build the indexes once after the insert
+        deferred_indexes = []
+        if new_rows and (drop_existing or len(new_rows) >= DEFER_INDEXES_MIN_ROWS):
+            deferred_indexes = list(Question.__table__.indexes)
+            for index in deferred_indexes:
+                index.drop(bind=db.connection(), checkfirst=True)
+
+        try:
+            bulk_insert(db, Question.__table__, new_rows)
+        except Exception:
+            # pysqlite autocommits DDL issued outside a transaction, so a rollback does not
+            # bring dropped indexes back; rebuild them before the error propagates
+            db.rollback()
+            for index in deferred_indexes:
+                index.create(bind=db.connection(), checkfirst=True)
+            db.commit()
+            raise
+
+        for index in deferred_indexes:
+            index.create(bind=db.connection())
+
+        db.bulk_update_mappings(Question, update_rows)
         db.commit()
 
         print(f"\n✅ Import completed successfully!")
@@ -296,7 +388,7 @@ def import_questions_from_json(
         print(f"   🔄 Updated: {updated}")
 
         # Final counts
-        total_questions = db.query(Question).count()
+        total_questions = existing_count + imported
         print(f"   📊 Total questions in database: {total_questions}")
 
         return {
@@ -7,26 +7,32 @@ to test the scoring system, ensuring correct answers exist for all questions.
 
 Usage:
     python populate_sample_answers.py
+    python populate_sample_answers.py --verbose  # Also report per-question and per-type counts
+    python populate_sample_answers.py --workers 4 --seed 42  # Generate answers in 4 processes, reproducibly
 """
 
 import sys
 import os
+import argparse
 from pathlib import Path
 import json
-import random
 from datetime import datetime, timedelta
-import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 
 # Add backend directory to Python path for imports
 backend_path = Path(__file__).parent / "backend"
 sys.path.insert(0, str(backend_path))
 
+from sqlalchemy import case, func, select
+
 # Import models from backend package
-from models import SessionLocal, User, Question, Game, Answer, Base, engine
+from models import SessionLocal, User, Question, Game, Answer, Base, engine, bulk_insert
 
 
-def create_sample_users(count=50):
-    """Create sample users with realistic names"""
+def create_sample_users(rng, count=50):
+    """Build insert rows for sample users with realistic names"""
 
     first_names = [
         "Alice", "Bob", "Charlie", "Diana", "Eve", "Frank", "Grace", "Henry",
@@ -47,37 +53,34 @@ def create_sample_users(count=50):
         "Adams", "Nelson", "Baker", "Hall", "Rivera", "Campbell", "Mitchell"
     ]
 
-    users = []
-    for i in range(count):
-        first_name = random.choice(first_names)
-        last_name = random.choice(last_names)
-        full_name = f"{first_name} {last_name}"
-
-        user = User(
-            name=full_name,
-            role="participant",
-            session_id=str(uuid.uuid4())
-        )
-        users.append(user)
+    # Names and session ids for every user in a few batch calls
+    first = rng.choice(first_names, size=count).tolist()
+    last = rng.choice(last_names, size=count).tolist()
+    raw = os.urandom(count * 16)
 
-    return users
+    return [
+        {
+            "name": f"{first_name} {last_name}",
+            "role": "participant",
+            "session_id": raw[i * 16:(i + 1) * 16].hex()
+        }
+        for i, (first_name, last_name) in enumerate(zip(first, last))
+    ]
 
 
-def get_fill_blank_answers(correct_answer):
+def get_fill_blank_answers(correct_answer, rng):
     """Generate realistic answers for fill-in-the-blank questions"""
     answers = []
 
     # Always include the correct answer multiple times
-    answers.extend([correct_answer] * random.randint(5, 10))
+    answers.extend([correct_answer] * int(rng.integers(5, 11)))
 
     # Add close but incorrect answers
     if correct_answer.replace(" ", "").isdigit():
         # Numeric answers - add nearby numbers
         base_num = int(correct_answer)
-        for i in range(10):
-            offset = random.randint(1, 50)
-            wrong_num = base_num + random.choice([-1, 1]) * offset
-            answers.append(str(wrong_num))
+        offsets = rng.choice([-1, 1], size=10) * rng.integers(1, 51, size=10)
+        answers.extend(str(base_num + offset) for offset in offsets.tolist())
     else:
         # Text answers - add common misspellings/variations
         variations = {
@@ -96,35 +99,37 @@ def get_fill_blank_answers(correct_answer):
         "don't know", "pass", "random", "test", "answer"
     ]
 
-    while len(answers) < 30:
-        answers.append(random.choice(random_answers))
+    if len(answers) < 30:
+        answers.extend(rng.choice(random_answers, size=30 - len(answers)).tolist())
 
     return answers
 
 
-def get_multiple_choice_answers(correct_answer, options):
-    """Generate answers for multiple choice questions"""
-    answers = []
+def parse_options(answers_json, correct_answer):
+    """Decode a question's stored options, with placeholder options if missing or invalid"""
+    try:
+        options = json.loads(answers_json) if answers_json else None
+    except ValueError:
+        options = None
+    return options if isinstance(options, list) else [correct_answer, "Wrong1", "Wrong2", "Wrong3"]
+
 
-    # Parse options if they're JSON string
-    if isinstance(options, str):
-        try:
-            options = json.loads(options)
-        except:
-            options = [correct_answer, "Wrong1", "Wrong2", "Wrong3"]
+def get_multiple_choice_answers(correct_answer, options, rng):
+    """Generate answers for multiple choice questions from already-parsed options"""
+    answers = []
 
     # Many users choose correct answer
-    answers.extend([correct_answer] * random.randint(15, 25))
+    answers.extend([correct_answer] * int(rng.integers(15, 26)))
 
     # Others choose wrong answers
     wrong_options = [opt for opt in options if opt != correct_answer]
-    for wrong_opt in wrong_options:
-        answers.extend([wrong_opt] * random.randint(5, 10))
+    for wrong_opt, count in zip(wrong_options, rng.integers(5, 11, size=len(wrong_options)).tolist()):
+        answers.extend([wrong_opt] * count)
 
     return answers
 
 
-def get_word_cloud_answers(correct_answer):
+def get_word_cloud_answers(correct_answer, rng):
     """Generate diverse answers for word cloud questions"""
     base_answers = [
         "apple", "banana", "orange", "grape", "strawberry", "blueberry",
@@ -136,15 +141,124 @@ def get_word_cloud_answers(correct_answer):
 
     answers = []
     # Mix of correct and varied answers
-    answers.extend([correct_answer] * random.randint(5, 10))
-
-    for _ in range(25):
-        answers.append(random.choice(base_answers))
+    answers.extend([correct_answer] * int(rng.integers(5, 11)))
+    answers.extend(rng.choice(base_answers, size=25).tolist())
 
     return answers
 
 
-def populate_sample_answers():
+def _exact_matches(contents, correct_answer):
+    """Case-insensitive exact match of each answer against the correct answer"""
+    correct_lower = correct_answer.strip().lower()
+    return [content.strip().lower() == correct_lower for content in contents]
+
+
+def _time_based_scores(is_correct, low, rng):
+    """Random low-30 points for correct answers (simulated timing), 0 otherwise"""
+    draws = iter(rng.integers(low, 31, size=sum(is_correct)).tolist())
+    return [next(draws) if correct else 0 for correct in is_correct]
+
+
+def score_fill_in_the_blank(contents, correct_answer, rng):
+    """Exact match gets 30; non-exact get 0 (adjusted by proportional scoring later)"""
+    is_correct = _exact_matches(contents, correct_answer)
+    return is_correct, [30 if correct else 0 for correct in is_correct]
+
+
+def score_multiple_choice(contents, correct_answer, rng):
+    is_correct = [content == correct_answer for content in contents]
+    return is_correct, _time_based_scores(is_correct, 20, rng)
+
+
+def score_wheel_of_fortune(contents, correct_answer, rng):
+    is_correct = _exact_matches(contents, correct_answer)
+    return is_correct, _time_based_scores(is_correct, 25, rng)
+
+
+def score_pictionary(contents, correct_answer, rng):
+    # Simple semantic check
+    is_correct = _exact_matches(contents, correct_answer)
+    return is_correct, _time_based_scores(is_correct, 20, rng)
+
+
+def score_no_points(contents, correct_answer, rng):
+    """word_cloud (and unknown types) get 0 score"""
+    return [False] * len(contents), [0] * len(contents)
+
+
+# Scorer per question type, each taking (contents, correct_answer, rng) -> (is_correct, scores)
+SCORERS = {
+    "fill_in_the_blank": score_fill_in_the_blank,
+    "multiple_choice": score_multiple_choice,
+    "wheel_of_fortune": score_wheel_of_fortune,
+    "pictionary": score_pictionary,
+}
+
+
+def gen_rows_for_question(args):
+    """
+    Generate one question's answer rows.
+
+    Takes a (question_id, type, correct_answer, options, user_ids, game_id, base_time, seed)
+    tuple and is module-level so ProcessPoolExecutor workers can run it.
+    """
+    question_id, question_type, correct_answer, options, user_ids, game_id, base_time, seed = args
+    rng = np.random.default_rng(seed)
+
+    # Randomly select which users will answer this question (70-90% participation)
+    # choice without replacement is already in random order, so no separate shuffle is needed
+    num_answering = int(rng.integers(int(0.7 * len(user_ids)), int(0.9 * len(user_ids)) + 1))
+    answering_users = rng.choice(user_ids, size=num_answering, replace=False).tolist()
+
+    answers_content = []
+
+    # Generate appropriate answers based on question type
+    if question_type == "fill_in_the_blank":
+        answers_content = get_fill_blank_answers(correct_answer, rng)
+    elif question_type == "multiple_choice":
+        answers_content = get_multiple_choice_answers(correct_answer, options, rng)
+    elif question_type == "word_cloud":
+        answers_content = get_word_cloud_answers(correct_answer, rng)
+    elif question_type == "wheel_of_fortune":
+        # Mix of correct and incorrect attempts
+        answers_content = [correct_answer] * int(rng.integers(3, 9))
+        wrong_attempts = ["wrong", "incorrect", "no", "idk", "pass", "skip"]
+        answers_content.extend(rng.choice(wrong_attempts, size=20).tolist())
+    elif question_type == "pictionary":
+        # Semantic variations
+        answers_content = [correct_answer] * int(rng.integers(5, 11))
+        variations = ["similar", "close", "almost", "near", "kind of"]
+        answers_content.extend(rng.choice(variations, size=15).tolist())
+
+    # Assign answers to the (already randomly ordered) users
+    num_answers = min(len(answering_users), len(answers_content))
+
+    # Build the answers column by column, then emit the rows in one pass
+    user_ids_q = answering_users[:num_answers]
+    contents = answers_content[:num_answers]  # num_answers never exceeds len(answers_content)
+
+    # Calculate correctness and score with the question type's scorer
+    scorer = SCORERS.get(question_type, score_no_points)
+    is_correct, scores = scorer(contents, correct_answer, rng)
+
+    # All timestamps at once, 2 seconds apart (simulate quiz progression)
+    answer_times = (np.datetime64(base_time) + np.arange(num_answers) * np.timedelta64(2, "s")).tolist()
+
+    return [
+        {
+            "user_id": user_id,
+            "question_id": question_id,
+            "game_id": game_id,
+            "content": content,
+            "is_correct": correct,
+            "score": score,
+            "timestamp": answer_time
+        }
+        for user_id, content, correct, score, answer_time in zip(user_ids_q, contents, is_correct, scores, answer_times)
+    ]
+
+
+def populate_sample_answers(verbose: bool = False, workers: int = 1, seed: int = None):
     """Populate database with sample users and answers"""
 
     print("🎄 All-Hands Quiz Game - Sample Answers Population")
@@ -155,9 +269,10 @@ def populate_sample_answers():
     try:
         # Create sample users
         print("👥 Creating 50 sample users...")
-        users = create_sample_users(50)
-        for user in users:
-            db.add(user)
+        rng = np.random.default_rng(seed)
+        user_rows = create_sample_users(rng, 50)
+        # One executemany insert; only the new ids are needed below
+        user_ids = db.execute(User.__table__.insert().returning(User.__table__.c.id), user_rows).scalars().all()
         db.commit()
 
         # Create a sample game
@@ -167,123 +282,70 @@ def populate_sample_answers():
         db.commit()
         db.refresh(game)
 
-        # Get all questions
-        questions = db.query(Question).order_by(Question.order).all()
+        # Get all questions as plain rows; only these columns are used below
+        questions = db.execute(
+            select(Question.id, Question.type, Question.content, Question.correct_answer, Question.answers)
+            .order_by(Question.order)
+        ).all()
         print(f"📝 Found {len(questions)} questions to answer")
 
-        total_answers = 0
-
-        # For each question, generate answers from users
-        for question in questions:
-            print(f"  Answering: {question.content[:50]}...")
-
-            # Randomly select which users will answer this question (70-90% participation)
-            num_answering = random.randint(int(0.7 * len(users)), int(0.9 * len(users)))
-            answering_users = random.sample(users, num_answering)
-
-            answers_content = []
-
-            # Generate appropriate answers based on question type
-            if question.type == "fill_in_the_blank":
-                answers_content = get_fill_blank_answers(question.correct_answer)
-            elif question.type == "multiple_choice":
-                answers_content = get_multiple_choice_answers(question.correct_answer, question.answers)
-            elif question.type == "word_cloud":
-                answers_content = get_word_cloud_answers(question.correct_answer)
-            elif question.type == "wheel_of_fortune":
-                # Mix of correct and incorrect attempts
-                answers_content = [question.correct_answer] * random.randint(3, 8)
-                wrong_attempts = ["wrong", "incorrect", "no", "idk", "pass", "skip"]
-                answers_content.extend(random.choices(wrong_attempts, k=20))
-            elif question.type == "pictionary":
-                # Semantic variations
-                answers_content = [question.correct_answer] * random.randint(5, 10)
-                variations = ["similar", "close", "almost", "near", "kind of"]
-                answers_content.extend(random.choices(variations, k=15))
-
-            # Shuffle users and assign answers
-            random.shuffle(answering_users)
-            num_answers = min(len(answering_users), len(answers_content))
-
-            base_time = datetime.utcnow() - timedelta(minutes=30)  # Quiz started 30 min ago
-
-            for i, user in enumerate(answering_users[:num_answers]):
-                answer_content = answers_content[i % len(answers_content)]
-
-                # Calculate score based on question type
-                score = 0
-                is_correct = False
-
-                if question.type == "fill_in_the_blank":
-                    # Check if exact match
-                    if answer_content.strip().lower() == question.correct_answer.strip().lower():
-                        score = 30  # Exact match gets 30
-                        is_correct = True
-                    # For now, non-exact get 0 (will be adjusted by proportional scoring later)
-                elif question.type == "multiple_choice":
-                    is_correct = (answer_content == question.correct_answer)
-                    if is_correct:
-                        # Simulate time-based scoring (20-30 points)
-                        score = random.randint(20, 30)
-                elif question.type == "wheel_of_fortune":
-                    is_correct = (answer_content.strip().lower() == question.correct_answer.strip().lower())
-                    if is_correct:
-                        score = random.randint(25, 30)  # Time-based for correct
-                elif question.type == "pictionary":
-                    # Simple semantic check
-                    is_correct = (answer_content.strip().lower() == question.correct_answer.strip().lower())
-                    if is_correct:
-                        score = random.randint(20, 30)
-                # word_cloud gets 0 score as before
-
-                # Create answer with timestamp (simulate quiz progression)
-                answer_time = base_time + timedelta(seconds=i * 2)  # 2 seconds between answers
-
-                answer = Answer(
-                    user_id=user.id,
-                    question_id=question.id,
-                    game_id=game.id,
-                    content=answer_content,
-                    is_correct=is_correct,
-                    score=score,
-                    timestamp=answer_time
-                )
-                db.add(answer)
-                total_answers += 1
-
+        # One independent seed per question, so generation can run in any process and order
+        seeds = np.random.SeedSequence(seed).spawn(len(questions))
+        base_time = datetime.utcnow() - timedelta(minutes=30)  # Quiz started 30 min ago
+        tasks = []
+        for (question_id, question_type, content, correct_answer, answers_json), question_seed in zip(questions, seeds):
+            print(f"  Answering: {content[:50]}...")
+            # Multiple-choice options are decoded exactly once, here
+            options = parse_options(answers_json, correct_answer) if question_type == "multiple_choice" else None
+            tasks.append((question_id, question_type, correct_answer, options,
+                          user_ids, game.id, base_time, question_seed))
+
+        # Generation is pure CPU with no cross-question dependency; SQLite writes stay in this process
+        if workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+                question_rows = list(pool.map(gen_rows_for_question, tasks))
+        else:
+            question_rows = [gen_rows_for_question(task) for task in tasks]
+
+        # Rows for every question, inserted with multi-row INSERT statements
+        answer_rows = [row for rows in question_rows for row in rows]
+        total_answers = len(answer_rows)
+
+        bulk_insert(db, Answer.__table__, answer_rows)
         db.commit()
 
         # Now run proportional scoring for fill-in-the-blank questions
         print("🔢 Running proportional scoring for fill-in-the-blank questions...")
-        from main import compute_top10_proportional_scores
+        from main import compute_top10_proportional_scores_bulk
 
-        fill_blank_questions = db.query(Question).filter(Question.type == "fill_in_the_blank").all()
-        for question in fill_blank_questions:
-            compute_top10_proportional_scores(db, question.id, game.id, question.correct_answer)
-
-        db.commit()
+        # All fill-in-the-blank questions of the game in one pass and one commit
+        compute_top10_proportional_scores_bulk(db, game.id)
 
         # Verification
         print("\n✅ Sample data populated successfully!")
-        print(f"👥 Users created: {len(users)}")
+        print(f"👥 Users created: {len(user_ids)}")
         print(f"📊 Total answers: {total_answers}")
 
-        # Check distribution
-        answer_counts = db.query(Question.type, Question.content,
-                               db.func.count(Answer.id)).join(Answer).group_by(Question.id).all()
-
-        print("\n📈 Answers per question:")
-        for qtype, content, count in answer_counts:
-            preview = content[:40] + "..." if len(content) > 40 else content
-            print(f"   • {qtype}: {count} answers - {preview}")
-
-        # Check correct answers
-        correct_counts = db.query(Question.type, db.func.count(Answer.id)).join(Answer).filter(
-            Answer.is_correct == True).group_by(Question.type).all()
-
-        print("\n✅ Correct answers by type:")
-        for qtype, count in correct_counts:
-            print(f"   • {qtype}: {count} correct answers")
+        if verbose:
+            # Check distribution and correct answers with one pass over the answers table
+            answer_counts = db.query(
+                Question.type,
+                Question.content,
+                func.count(Answer.id),
+                func.sum(case((Answer.is_correct, 1), else_=0))
+            ).join(Answer, Answer.question_id == Question.id).group_by(Question.id).all()
+
+            print("\n📈 Answers per question:")
+            correct_counts = {}
+            for qtype, content, count, correct in answer_counts:
+                preview = content[:40] + "..." if len(content) > 40 else content
+                print(f"   • {qtype}: {count} answers - {preview}")
+                if correct:
+                    correct_counts[qtype] = correct_counts.get(qtype, 0) + correct
+
+            print("\n✅ Correct answers by type:")
+            for qtype, count in correct_counts.items():
+                print(f"   • {qtype}: {count} correct answers")
 
         print("\n🚀 Database ready for testing!")
         print("   Start server: python backend/main.py")
@@ -299,8 +361,28 @@ def populate_sample_answers():
 
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description="Populate the quiz database with sample users and answers")
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Report answer counts per question and correct answers per type"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used to generate answers (default: 1, in-process; each worker re-imports the models module, "
+             "so a pool only pays off for large question sets)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Seed for reproducible answer generation"
+    )
+    args = parser.parse_args()
+
     try:
-        populate_sample_answers()
+        populate_sample_answers(verbose=args.verbose, workers=args.workers, seed=args.seed)
     except KeyboardInterrupt:
         print("\n⏹️  Operation cancelled by user")
     except Exception as e:
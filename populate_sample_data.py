@@ -13,211 +13,63 @@ import sys
 import os
 from pathlib import Path
 import json
+from collections import Counter
 
 # Add backend directory to Python path for imports
 backend_path = Path(__file__).parent / "backend"
 sys.path.insert(0, str(backend_path))
 
+from sqlalchemy import func
+
 # Import models from backend package
-from models import SessionLocal, Question, Base, engine
+from models import SessionLocal, Question, engine, question_content_hash
+
+
+# Column names for the rows in SAMPLE_QUESTIONS
+SAMPLE_QUESTION_KEYS = ("type", "content", "correct_answer", "category", "allow_multiple", "answers")
+
+# One tuple per sample question; answers are the options for multiple choice, None otherwise
+SAMPLE_QUESTIONS = [
+    # Fill in the Blank Questions
+    ("fill_blank", "The capital city of France is _______.", "Paris", "geography", True, None),
+    ("fill_blank", "The chemical symbol for gold is _______.", "Au", "science", True, None),
+    ("fill_blank", "World War II ended in the year _______.", "1945", "history", True, None),
+    ("fill_blank", "The largest planet in our solar system is _______.", "Jupiter", "science", True, None),
+    ("fill_blank", "The first computer programmer was _______.", "Ada Lovelace", "history", True, None),
+
+    # Multiple Choice Questions
+    ("multiple_choice", "Which of these is NOT a primary color?", "Green", "science", False, ["Red", "Blue", "Green", "Yellow"]),
+    ("multiple_choice", "Which continent is the largest by land area?", "Asia", "geography", False, ["Africa", "Asia", "North America", "Europe"]),
+    ("multiple_choice", "Who was the first President of the United States?", "George Washington", "history", False, ["Thomas Jefferson", "John Adams", "George Washington", "Benjamin Franklin"]),
+    ("multiple_choice", "What is the most spoken language in the world by number of native speakers?", "Mandarin Chinese", "general", False, ["English", "Spanish", "Mandarin Chinese", "Hindi"]),
+    ("multiple_choice", "Which of these animals is a marsupial?", "Kangaroo", "science", False, ["Kangaroo", "Elephant", "Lion", "Giraffe"]),
+
+    # Word Cloud Questions
+    ("word_cloud", "Name a fruit that is typically red:", "apple", "general", True, None),
+    ("word_cloud", "What is your favorite Christmas tradition?", "tree", "general", True, None),
+    ("word_cloud", "Name a country in Europe:", "France", "geography", True, None),
+    ("word_cloud", "What is something you're grateful for this year?", "health", "general", True, None),
+    ("word_cloud", "Name a famous scientist:", "Einstein", "science", True, None),
+
+    # Drawing Questions
+    ("drawing", "Draw a Christmas tree with ornaments:", "christmas tree", "general", True, None),
+    ("drawing", "Draw a simple house with a chimney:", "house", "general", True, None),
+    ("drawing", "Draw the continents of the world:", "world map", "geography", True, None),
+    ("drawing", "Draw a light bulb (representing innovation):", "light bulb", "science", True, None),
+    ("drawing", "Draw a timeline showing major historical events:", "timeline", "history", True, None),
+
+    # Wheel of Fortune Questions
+    ("wheel_of_fortune", "Unscramble: R A P I S", "Paris", "geography", True, None),
+    ("wheel_of_fortune", "Complete the phrase: E = mc ___", "squared", "science", True, None),
+    ("wheel_of_fortune", "Who was the first man on the moon? (Last name)", "Armstrong", "history", True, None),
+    ("wheel_of_fortune", "What is the color of the sky on a clear day?", "blue", "science", True, None),
+    ("wheel_of_fortune", "What holiday is celebrated on December 25th?", "Christmas", "general", True, None)
+]
 
 
 def create_sample_questions():
-    """Create sample questions for all question types and categories"""
-
-    questions_data = [
-        # Fill in the Blank Questions
-        {
-            "type": "fill_blank",
-            "content": "The capital city of France is _______.",
-            "correct_answer": "Paris",
-            "category": "geography",
-            "allow_multiple": True
-        },
-        {
-            "type": "fill_blank",
-            "content": "The chemical symbol for gold is _______.",
-            "correct_answer": "Au",
-            "category": "science",
-            "allow_multiple": True
-        },
-        {
-            "type": "fill_blank",
-            "content": "World War II ended in the year _______.",
-            "correct_answer": "1945",
-            "category": "history",
-            "allow_multiple": True
-        },
-        {
-            "type": "fill_blank",
-            "content": "The largest planet in our solar system is _______.",
-            "correct_answer": "Jupiter",
-            "category": "science",
-            "allow_multiple": True
-        },
-        {
-            "type": "fill_blank",
-            "content": "The first computer programmer was _______.",
-            "correct_answer": "Ada Lovelace",
-            "category": "history",
-            "allow_multiple": True
-        },
-
-        # Multiple Choice Questions
-        {
-            "type": "multiple_choice",
-            "content": "Which of these is NOT a primary color?",
-            "answers": json.dumps(["Red", "Blue", "Green", "Yellow"]),
-            "correct_answer": "Green",
-            "category": "science",
-            "allow_multiple": False
-        },
-        {
-            "type": "multiple_choice",
-            "content": "Which continent is the largest by land area?",
-            "answers": json.dumps(["Africa", "Asia", "North America", "Europe"]),
-            "correct_answer": "Asia",
-            "category": "geography",
-            "allow_multiple": False
-        },
-        {
-            "type": "multiple_choice",
-            "content": "Who was the first President of the United States?",
-            "answers": json.dumps(["Thomas Jefferson", "John Adams", "George Washington", "Benjamin Franklin"]),
-            "correct_answer": "George Washington",
-            "category": "history",
-            "allow_multiple": False
-        },
-        {
-            "type": "multiple_choice",
-            "content": "What is the most spoken language in the world by number of native speakers?",
-            "answers": json.dumps(["English", "Spanish", "Mandarin Chinese", "Hindi"]),
-            "correct_answer": "Mandarin Chinese",
-            "category": "general",
-            "allow_multiple": False
-        },
-        {
-            "type": "multiple_choice",
-            "content": "Which of these animals is a marsupial?",
-            "answers": json.dumps(["Kangaroo", "Elephant", "Lion", "Giraffe"]),
-            "correct_answer": "Kangaroo",
-            "category": "science",
-            "allow_multiple": False
-        },
-
-        # Word Cloud Questions
-        {
-            "type": "word_cloud",
-            "content": "Name a fruit that is typically red:",
-            "correct_answer": "apple",
-            "category": "general",
-            "allow_multiple": True
-        },
-        {
-            "type": "word_cloud",
-            "content": "What is your favorite Christmas tradition?",
-            "correct_answer": "tree",
-            "category": "general",
-            "allow_multiple": True
-        },
-        {
-            "type": "word_cloud",
-            "content": "Name a country in Europe:",
-            "correct_answer": "France",
-            "category": "geography",
-            "allow_multiple": True
-        },
-        {
-            "type": "word_cloud",
-            "content": "What is something you're grateful for this year?",
-            "correct_answer": "health",
-            "category": "general",
-            "allow_multiple": True
-        },
-        {
-            "type": "word_cloud",
-            "content": "Name a famous scientist:",
-            "correct_answer": "Einstein",
-            "category": "science",
-            "allow_multiple": True
-        },
-
-        # Drawing Questions
-        {
-            "type": "drawing",
-            "content": "Draw a Christmas tree with ornaments:",
-            "correct_answer": "christmas tree",
-            "category": "general",
-            "allow_multiple": True
-        },
-        {
-            "type": "drawing",
-            "content": "Draw a simple house with a chimney:",
-            "correct_answer": "house",
-            "category": "general",
-            "allow_multiple": True
-        },
-        {
-            "type": "drawing",
-            "content": "Draw the continents of the world:",
-            "correct_answer": "world map",
-            "category": "geography",
-            "allow_multiple": True
-        },
-        {
-            "type": "drawing",
-            "content": "Draw a light bulb (representing innovation):",
-            "correct_answer": "light bulb",
-            "category": "science",
-            "allow_multiple": True
-        },
-        {
-            "type": "drawing",
-            "content": "Draw a timeline showing major historical events:",
-            "correct_answer": "timeline",
-            "category": "history",
-            "allow_multiple": True
-        },
-
-        # Wheel of Fortune Questions
-        {
-            "type": "wheel_of_fortune",
-            "content": "Unscramble: R A P I S",
-            "correct_answer": "Paris",
-            "category": "geography",
-            "allow_multiple": True
-        },
-        {
-            "type": "wheel_of_fortune",
-            "content": "Complete the phrase: E = mc ___",
-            "correct_answer": "squared",
-            "category": "science",
-            "allow_multiple": True
-        },
-        {
-            "type": "wheel_of_fortune",
-            "content": "Who was the first man on the moon? (Last name)",
-            "correct_answer": "Armstrong",
-            "category": "history",
-            "allow_multiple": True
-        },
-        {
-            "type": "wheel_of_fortune",
-            "content": "What is the color of the sky on a clear day?",
-            "correct_answer": "blue",
-            "category": "science",
-            "allow_multiple": True
-        },
-        {
-            "type": "wheel_of_fortune",
-            "content": "What holiday is celebrated on December 25th?",
-            "correct_answer": "Christmas",
-            "category": "general",
-            "allow_multiple": True
-        }
-    ]
-
-    return questions_data
+    """Create sample questions for all question types and categories (answers as option lists)"""
+    return [dict(zip(SAMPLE_QUESTION_KEYS, row)) for row in SAMPLE_QUESTIONS]
 
 
 def populate_database():
@@ -226,47 +78,40 @@ def populate_database():
     print("🎄 All-Hands Quiz Game - Sample Data Population")
     print("=" * 50)
 
-    # Create database tables
-    print("📋 Creating database tables...")
-    Base.metadata.create_all(bind=engine)
+    # Tables, added columns and indexes are created when models is imported
 
     # Create session
     db = SessionLocal()
 
     try:
-        # Clear existing questions
-        existing_count = db.query(Question).count()
-        if existing_count > 0:
-            print(f"🗑️  Clearing {existing_count} existing questions...")
-            db.query(Question).delete()
-            db.commit()
-
         # Create sample questions
         questions_data = create_sample_questions()
-        questions_created = 0
-
-        print(f"📝 Creating {len(questions_data)} sample questions...")
 
+        # Core inserts skip the ORM event that fills content_hash, so set it here. Options are
+        # serialized once, and every row gets an answers key: executemany takes its columns from the first row
         for question_data in questions_data:
-            question = Question(**question_data)
-            db.add(question)
-            questions_created += 1
-
-            # Print progress
-            if questions_created % 5 == 0:
-                print(f"  ✓ Created {questions_created} questions...")
-
-        # Commit all changes
-        db.commit()
-
-        # Verify creation
-        total_questions = db.query(Question).count()
-        questions_by_type = {}
-        questions_by_category = {}
-
-        for question in db.query(Question).all():
-            questions_by_type[question.type] = questions_by_type.get(question.type, 0) + 1
-            questions_by_category[question.category] = questions_by_category.get(question.category, 0) + 1
+            answers = question_data.get("answers")
+            question_data["content_hash"] = question_content_hash(
+                question_data["type"], question_data["content"], question_data["correct_answer"], answers
+            )
+            question_data["answers"] = json.dumps(answers) if answers else None
+
+        # Clear and insert in one transaction (a single commit), no ORM session bookkeeping
+        with engine.begin() as conn:
+            # The DELETE's rowcount reports what was cleared, no separate COUNT needed
+            cleared = conn.execute(Question.__table__.delete()).rowcount
+            if cleared > 0:
+                print(f"🗑️  Cleared {cleared} existing questions")
+
+            print(f"📝 Creating {len(questions_data)} sample questions...")
+            conn.execute(Question.__table__.insert(), questions_data)
+        print(f"  ✓ Created {len(questions_data)} questions")
+
+        # Verify creation: per-type counts aggregated by SQLite in one query
+        questions_by_type = dict(db.query(Question.type, func.count(Question.id)).group_by(Question.type).all())
+        total_questions = sum(questions_by_type.values())
+        # Category is not stored on Question, so it is counted from the sample data itself
+        questions_by_category = Counter(question_data["category"] for question_data in questions_data)
 
         print("\n✅ Database populated successfully!")
         print(f"📊 Total questions: {total_questions}")
@@ -0,0 +1,17 @@
+"""
+Shared pytest setup: run the whole test session against a temporary database
+"""
+
+import os
+import shutil
+import tempfile
+
+# Set before any test module imports backend models, which create and migrate the
+# database at import time and which the app's lifespan cleanup then empties. Always
+# overridden: a TRIVIA_DATABASE_URL left in the shell may point at a real database
+TEST_DB_DIR = tempfile.mkdtemp(prefix="trivia_tests_")
+os.environ["TRIVIA_DATABASE_URL"] = f"sqlite:///{TEST_DB_DIR}/test_trivia.db"
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(TEST_DB_DIR, ignore_errors=True)
@@ -6,19 +6,210 @@ Interactive Load Test Client - Connect 150 simulated users and test all question
 import asyncio
 import json
 import websockets
-import time
 import random
-import threading
 from collections import defaultdict
+from functools import lru_cache
+from itertools import accumulate
+import math
 import sys
+import os
+import socket
 import ssl
+from urllib.parse import urlsplit
+
+try:
+    import orjson  # Optional: faster encode/decode of the frames every participant handles
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop  # Optional (ships with uvicorn[standard]): faster event loop for many sockets
+except ImportError:
+    uvloop = None
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj) -> str:
+        # Decoded to str so it still goes out as a text frame (the server reads text JSON)
+        return orjson.dumps(obj).decode()
+else:
+    _loads = json.loads
+    _dumps = json.dumps
+
+# Per-user progress prints serialize 150 coroutines on stdout; off unless LOADTEST_VERBOSE=1 (errors always print)
+VERBOSE = os.environ.get("LOADTEST_VERBOSE", "0") == "1"
+
+# Disable SSL certificate verification for testing; one context (and CA bundle load) shared by every participant
+_SHARED_SSL_CTX = ssl.create_default_context()
+_SHARED_SSL_CTX.check_hostname = False
+_SHARED_SSL_CTX.verify_mode = ssl.CERT_NONE
+
+# Answer pools are module-level tuples so they are not rebuilt on every answer
+
+# Word cloud answers: a mix of single words and short phrases for good clustering
+_WORD_CLOUD_ANSWERS = (
+    # Popular responses (will create large clusters)
+    "cookies", "chocolate", "family", "love", "peace", "joy",
+    "cookies", "chocolate", "family", "love", "peace", "joy",  # Repeated for clustering
+
+    # Medium frequency
+    "tradition", "giving", "happiness", "warmth", "light", "hope",
+    "tradition", "giving", "happiness", "warmth", "light", "hope",
+
+    # Individual responses (smaller clusters)
+    "eggnog", "fireplace", "snowflakes", "caroling", "presents",
+    "hot chocolate", "fruitcake", "pine tree", "reindeer", "sleigh",
+    "gingerbread", "candy cane", "stocking", "ornaments", "wreath",
+    "mistletoe", "chestnuts", "roasting", "chestnuts", "roasting",  # Phrases
+    "silent night", "holy night", "jingle bells", "santa claus"
+)
+
+# Generic wrong answers for non-numeric fill in the blank questions
+_WRONG_FIB_TEXT = ("wrong", "incorrect", "no idea", "idk", "pass", "skip")
+
+# Plausible wrong answers for the cloud-themed pictionary drawing
+_PICTIONARY_WRONG = (
+    "sky", "plane", "travel", "flight", "airplane", "mountain",
+    "ocean", "water", "sun", "moon", "star", "bird", "wing"
+)
+
+# Plausible wrong phrase guesses for the travel/teamwork wheel of fortune theme
+_WHEEL_WRONG = (
+    "Holiday Team Journey", "Cloud Travel Adventure", "Holiday Travel Team",
+    "Cloud Team Holiday", "Journey Cloud Holiday", "Team Holiday Cloud",
+    "Travel Holiday Cloud", "Holiday Cloud Travel", "Cloud Holiday Team"
+)
+
+DEFAULT_SERVER_URL = "wss://venus.aisandbox.ugbu.oraclepdemos.com/trivia/ws/participant"
+
+def _resolve_server(server_url: str) -> list:
+    """
+    Resolve the server's addresses once for every participant.
+
+    Returns one set of websockets.connect kwargs per resolved address, in getaddrinfo
+    order, each dialing that IP while keeping the hostname for TLS SNI and certificates.
+    Participants try them in turn, as create_connection does. Empty if resolution fails,
+    so each connection resolves on its own as before.
+    """
+    parts = urlsplit(server_url)
+    secure = parts.scheme == "wss"
+    port = parts.port or (443 if secure else 80)
+    try:
+        addrinfo = socket.getaddrinfo(parts.hostname, port, type=socket.SOCK_STREAM)
+    except OSError as e:
+        print(f"⚠️  Could not resolve {parts.hostname}: {e}")
+        return []
+
+    connect_targets = []
+    for host in dict.fromkeys(sockaddr[0] for *_, sockaddr in addrinfo):  # Unique, in order
+        target = {"host": host, "port": port}
+        if secure:
+            target["server_hostname"] = parts.hostname
+        connect_targets.append(target)
+    return connect_targets
+
+# Thinking-time wake-ups are quantized to this many seconds so participants due together share one timer
+THINKING_BUCKET_SECONDS = 0.1
+_bucket_events = {}
+
+async def _bucket_wait(delay: float):
+    """Sleep roughly delay seconds, sharing a single loop timer with every waiter due in the same bucket"""
+    loop = asyncio.get_running_loop()
+    bucket = round((loop.time() + delay) / THINKING_BUCKET_SECONDS)
+    event = _bucket_events.get(bucket)
+    if event is None:
+        event = _bucket_events[bucket] = asyncio.Event()
+        loop.call_at(bucket * THINKING_BUCKET_SECONDS, _release_bucket, bucket)
+    await event.wait()
+
+def _release_bucket(bucket: int):
+    _bucket_events.pop(bucket).set()
+
+# Per-question answer data, computed once and shared by every participant: each one parses its
+# own copy of the question frame, so caching on the question dict would still repeat it per user
+@lru_cache(maxsize=256)
+def _wrong_options(correct_answer: str, options: tuple) -> tuple:
+    """Multiple choice options other than the correct one"""
+    return tuple(opt for opt in options if opt != correct_answer)
+
+# Progressive distance bands for wrong numeric fill in the blank answers, as (min, max) fractions of
+# the correct answer; a band's weight is its max distance
+_FIB_DISTANCE_BANDS = (
+    (0.05, 0.05),   # 5% of answers within 5% of correct
+    (0.05, 0.10),   # 10% of answers within 10% of correct
+    (0.15, 0.20),   # 15% of answers within 20% of correct
+    (0.25, 0.50),   # 25% of answers within 50% of correct
+    (0.40, 2.0),    # 40% of answers 50%-200% away from correct
+)
+_FIB_BAND_CUM_WEIGHTS = tuple(accumulate(band[1] for band in _FIB_DISTANCE_BANDS))
+# The same bands in whole percent, for integer correct answers
+_FIB_DISTANCE_BANDS_PCT = tuple(
+    (round(min_distance * 100), round(max_distance * 100)) for min_distance, max_distance in _FIB_DISTANCE_BANDS
+)
+
+@lru_cache(maxsize=256)
+def _fill_in_the_blank_ranges(correct_answer):
+    """
+    Integer (min, max) ranges above and below a numeric correct answer, one pair per distance band.
+
+    Returns None when correct_answer is not a finite number.
+    """
+    # Integer answers (the common case, e.g. years and counts) stay in exact integer arithmetic
+    if isinstance(correct_answer, (str, int)):
+        try:
+            return _fill_in_the_blank_int_ranges(int(correct_answer))
+        except ValueError:
+            pass
+
+    try:
+        correct_num = float(correct_answer)
+    except (ValueError, TypeError):
+        return None
+    if not math.isfinite(correct_num):
+        return None
+
+    ranges = []
+    for min_distance, max_distance in _FIB_DISTANCE_BANDS:
+        # Calculate actual value ranges for this band
+        abs_min_distance = min_distance * abs(correct_num) if correct_num != 0 else min_distance
+        abs_max_distance = max_distance * abs(correct_num) if correct_num != 0 else max_distance
+
+        # Ensure minimum distance of at least 1 unit
+        abs_min_distance = max(1, abs_min_distance)
+        abs_max_distance = max(abs_min_distance + 1, abs_max_distance)
+
+        # Above correct answer, and below it (kept positive)
+        above = (int(correct_num + abs_min_distance), int(correct_num + abs_max_distance))
+        below = (int(max(1, correct_num - abs_max_distance)), int(max(1, correct_num - abs_min_distance)))
+        ranges.append((above, below))
+    return tuple(ranges)
+
+def _fill_in_the_blank_int_ranges(correct_int: int) -> tuple:
+    """_fill_in_the_blank_ranges for an integer correct answer, with distances scaled by 100 to stay in ints"""
+    ranges = []
+    for min_pct, max_pct in _FIB_DISTANCE_BANDS_PCT:
+        # Ensure minimum distance of at least 1 unit (100 when scaled)
+        abs_min_scaled = max(100, min_pct * abs(correct_int))
+        abs_max_scaled = max(abs_min_scaled + 100, max_pct * abs(correct_int))
+
+        # Above correct answer (truncated toward zero, as int() does), and below it (kept positive)
+        above = tuple(
+            (100 * correct_int + d) // 100 if 100 * correct_int + d >= 0 else -(-(100 * correct_int + d) // 100)
+            for d in (abs_min_scaled, abs_max_scaled)
+        )
+        below = (max(1, (100 * correct_int - abs_max_scaled) // 100), max(1, (100 * correct_int - abs_min_scaled) // 100))
+        ranges.append((above, below))
+    return tuple(ranges)
 
 class SimulatedParticipant:
     """Simulates a single quiz participant"""
 
 
-    def __init__(self, user_id: int, server_url: str = "wss://venus.aisandbox.ugbu.oraclepdemos.com/trivia/ws/participant"):
+    def __init__(self, user_id: int, server_url: str = DEFAULT_SERVER_URL, tester=None, connect_targets=None):
         self.user_id = user_id
+        self.connect_targets = connect_targets or [{}]  # Pre-resolved addresses shared by the tester; [{}] resolves per connect
+        self.tester = tester  # InteractiveLoadTester to report connect/disconnect transitions to
         self.user_name = f"TestUser_{user_id:03d}"
         self.server_url = server_url
         self.websocket = None
@@ -26,74 +217,121 @@ class SimulatedParticipant:
         self.current_question = None
         self.game_active = False
         self.total_score = 0
-
-        # Disable SSL certificate verification for testing
-        self.ssl_context = ssl.create_default_context()
-        self.ssl_context.check_hostname = False
-        self.ssl_context.verify_mode = ssl.CERT_NONE
+        # Per-user RNG seeded on user_id: consistent but varied answers without reseeding the global RNG
+        self._rng = random.Random(user_id)
+        # Generated answers by question, so a re-pushed question gets the same answer without regenerating it
+        self._answer_cache = {}
+
+        self.ssl_context = _SHARED_SSL_CTX
+        # Join message serialized once (kept as str so it is sent as a text frame)
+        self._join_payload = _dumps({"type": "join", "name": self.user_name})
+        # Connection log lines only depend on the name and URL, so build them once
+        self._log_connecting = f"{self.user_name} connecting to {self.server_url}"
+        self._log_joined = f"✓ {self.user_name} joined"
+        # Message handlers by type, bound once; other message types are ignored
+        self._handlers = {
+            "quiz_started": self._on_quiz_started,
+            "question": self._on_question,
+            "personal_feedback": self._on_personal_feedback,
+            "quiz_ended": self._on_quiz_ended,
+        }
 
     async def connect_and_listen(self):
         """Connect to server and handle messages"""
         try:
-            print(f"{self.user_name} connecting to {self.server_url}")
-            async with websockets.connect(self.server_url, ssl=self.ssl_context) as websocket:
+            if VERBOSE:
+                print(self._log_connecting)
+            websocket = await self._open_websocket()
+            try:
                 self.websocket = websocket
-                self.connected = True
+                self._set_connected(True)
 
                 # Send join message
-                join_message = {
-                    "type": "join",
-                    "name": self.user_name
-                }
-                await websocket.send(json.dumps(join_message))
-                print(f"✓ {self.user_name} joined")
+                await websocket.send(self._join_payload)
+                if VERBOSE:
+                    print(self._log_joined)
 
                 # Listen for messages
                 async for message in websocket:
                     await self.handle_message(message)
+            finally:
+                await websocket.close()
 
         except Exception as e:
             print(f"✗ {self.user_name} connection error: {e}")
-            self.connected = False
+        finally:
+            self._set_connected(False)
+            # Drop the closed socket (and its buffers) and the last question so they can be reclaimed
+            self.websocket = None
+            self.current_question = None
+
+    async def _open_websocket(self):
+        """Open the websocket, trying each pre-resolved address in order until one accepts the connection"""
+        last_error = None
+        for target in self.connect_targets:
+            try:
+                # No permessage-deflate (per-frame zlib for small JSON) and keepalive pings every 60s instead of 20s
+                return await websockets.connect(
+                    self.server_url, ssl=self.ssl_context, compression=None, max_size=2**20, ping_interval=60,
+                    **target
+                )
+            except (OSError, asyncio.TimeoutError) as e:
+                last_error = e
+        raise last_error
+
+    def _set_connected(self, connected: bool):
+        """Record a connect/disconnect transition, keeping the tester's connected count in step"""
+        if connected == self.connected:
+            return
+        self.connected = connected
+        if self.tester is not None:
+            self.tester._update_connected(1 if connected else -1)
 
     async def handle_message(self, message):
         """Handle incoming WebSocket messages"""
         try:
-            data = json.loads(message)
-
-            if data["type"] == "quiz_started":
-                self.game_active = True
-                print(f"🎯 {self.user_name} ready for quiz")
-
-            elif data["type"] == "question":
-                self.current_question = data["question"]
-                question_type = self.current_question.get("type", "fill_in_the_blank")
-                print(f"❓ {self.user_name} received {question_type} question: {self.current_question['content'][:50]}...")
-
-                # Simulate realistic thinking time (0.5-8 seconds with varied distribution)
-                # Most people answer quickly (1-3s), some take longer (4-8s), few very slow
-                thinking_time = random.choices(
-                    [random.uniform(0.5, 2), random.uniform(2, 4), random.uniform(4, 8)],
-                    weights=[0.6, 0.3, 0.1]  # 60% fast, 30% medium, 10% slow
-                )[0]
-                self.current_question["_simulated_thinking_time"] = thinking_time
-                await asyncio.sleep(thinking_time)
-
-                # Submit answer
-                await self.submit_answer()
-
-            elif data["type"] == "personal_feedback":
-                score = data.get("score", 0)
-                self.total_score += score
-                print(f"📊 {self.user_name} scored {score} points (total: {self.total_score})")
-
-            elif data["type"] == "quiz_ended":
-                self.game_active = False
-                print(f"🏁 {self.user_name} quiz ended (final score: {self.total_score})")
+            data = _loads(message)
+            handler = self._handlers.get(data["type"])
+            if handler is not None:
+                await handler(data)
 
         except Exception as e:
             print(f"Error handling message for {self.user_name}: {e}")
 
+    async def _on_quiz_started(self, data):
+        self.game_active = True
+        if VERBOSE:
+            print(f"🎯 {self.user_name} ready for quiz")
+
+    async def _on_question(self, data):
+        self.current_question = data["question"]
+        question_type = self.current_question.get("type", "fill_in_the_blank")
+        if VERBOSE:
+            print(f"❓ {self.user_name} received {question_type} question: {self.current_question['content'][:50]}...")
+
+        # Simulate realistic thinking time (0.5-8 seconds with varied distribution)
+        # Most people answer quickly (1-3s), some take longer (4-8s), few very slow
+        thinking_time = random.choices(
+            [random.uniform(0.5, 2), random.uniform(2, 4), random.uniform(4, 8)],
+            weights=[0.6, 0.3, 0.1]  # 60% fast, 30% medium, 10% slow
+        )[0]
+        self.current_question["_simulated_thinking_time"] = thinking_time
+        await _bucket_wait(thinking_time)
+
+        # Submit answer
+        await self.submit_answer()
+
+    async def _on_personal_feedback(self, data):
+        score = data.get("score", 0)
+        self.total_score += score
+        if VERBOSE:
+            print(f"📊 {self.user_name} scored {score} points (total: {self.total_score})")
+
+    async def _on_quiz_ended(self, data):
+        self.game_active = False
+        if VERBOSE:
+            print(f"🏁 {self.user_name} quiz ended (final score: {self.total_score})")
+
     async def submit_answer(self):
         """Submit an answer based on question type"""
         if not self.current_question or not self.websocket:
@@ -101,8 +339,19 @@ class SimulatedParticipant:
 
         question_type = self.current_question.get("type", "fill_in_the_blank")
 
-        # Generate realistic answers for each question type
-        answer = self._generate_answer_for_type(question_type)
+        # Generate realistic answers for each question type; the key includes the answer data in case it was edited.
+        # Wheel of fortune is never cached: its odds depend on the thinking time redrawn on every push
+        if question_type == "wheel_of_fortune":
+            answer = self._generate_answer_for_type(question_type)
+        else:
+            cache_key = (
+                self.current_question["id"], question_type,
+                self.current_question.get("correct_answer"), tuple(self.current_question.get("options") or ())
+            )
+            answer = self._answer_cache.get(cache_key)
+            if answer is None:
+                answer = self._generate_answer_for_type(question_type)
+                self._answer_cache[cache_key] = answer
 
         answer_message = {
             "type": "answer",
@@ -111,17 +360,15 @@ class SimulatedParticipant:
         }
 
         try:
-            await self.websocket.send(json.dumps(answer_message))
-            print(f"📝 {self.user_name} answered: '{answer}'")
+            await self.websocket.send(_dumps(answer_message))
+            if VERBOSE:
+                print(f"📝 {self.user_name} answered: '{answer}'")
         except Exception as e:
             print(f"Error sending answer for {self.user_name}: {e}")
 
     def _generate_answer_for_type(self, question_type: str) -> str:
         """Generate appropriate answers for each question type using real correct answers"""
 
-        # Use user_id as seed for consistent but varied answers
-        random.seed(self.user_id)
-
         correct_answer = self.current_question.get("correct_answer", "")
 
         if question_type == "wheel_of_fortune":
@@ -130,11 +377,11 @@ class SimulatedParticipant:
             # Rescale: thinking_time simulates how much of WOF is exposed (0 at .5s, 1 at 8s)
             tnorm = (min(max(t, 0.5), 8.0)-0.5)/7.5
             probability_correct = min(0.01 + 0.6 * tnorm, 0.6)
-            is_correct = random.random() < probability_correct
+            is_correct = self._rng.random() < probability_correct
         else:
             # Randomly make 3-5% of answers correct for realistic testing
-            correct_percentage = random.uniform(0.03, 0.05)
-            is_correct = random.random() < correct_percentage
+            correct_percentage = self._rng.uniform(0.03, 0.05)
+            is_correct = self._rng.random() < correct_percentage
 
         if question_type == "word_cloud":
             # Word cloud is subjective - always generate diverse responses
@@ -148,139 +395,67 @@ class SimulatedParticipant:
                 answer = correct_answer
             else:
                 # Choose wrong option from actual available options
-                wrong_options = [opt for opt in options if opt != correct_answer]
+                wrong_options = _wrong_options(correct_answer, tuple(options))
                 if wrong_options:
-                    answer = random.choice(wrong_options)
+                    answer = self._rng.choice(wrong_options)
                 else:
                     # Fallback if no wrong options available
-                    answer = f"Wrong option {random.randint(1, 3)}"
+                    answer = f"Wrong option {self._rng.randint(1, 3)}"
         elif question_type == "fill_in_the_blank":
             if is_correct and correct_answer:
                 answer = correct_answer
             else:
                 # Generate progressive distribution of wrong answers based on distance from correct
-                try:
-                    correct_num = float(correct_answer)
-
-                    # Create progressive distance bands with realistic distribution
-                    # 5% answers within 5% of correct, 10% within 10%, etc.
-                    distance_weights = [
-                        (0.05, 0.05),   # 5% of answers within 5% of correct
-                        (0.05, 0.10),   # 10% of answers within 10% of correct
-                        (0.15, 0.20),   # 15% of answers within 20% of correct
-                        (0.25, 0.50),   # 25% of answers within 50% of correct
-                        (0.40, 2.0),    # 40% of answers 50%-200% away from correct
-                    ]
-
-                    # Choose a distance band based on weights
-                    chosen_band = random.choices(
-                        distance_weights,
-                        weights=[band[1] for band in distance_weights]
-                    )[0]
-
-                    min_distance, max_distance = chosen_band
-
-                    # Calculate actual value ranges for this band
-                    abs_min_distance = min_distance * abs(correct_num) if correct_num != 0 else min_distance
-                    abs_max_distance = max_distance * abs(correct_num) if correct_num != 0 else max_distance
-
-                    # Ensure minimum distance of at least 1 unit
-                    abs_min_distance = max(1, abs_min_distance)
-                    abs_max_distance = max(abs_min_distance + 1, abs_max_distance)
-
-                    # Generate number in the chosen distance band (both above and below)
-                    if random.random() < 0.5:  # 50% chance above or below
-                        # Above correct answer
-                        min_val = correct_num + abs_min_distance
-                        max_val = correct_num + abs_max_distance
-                    else:
-                        # Below correct answer (ensure positive)
-                        min_val = max(1, correct_num - abs_max_distance)
-                        max_val = max(1, correct_num - abs_min_distance)
-
-                    # Ensure valid range
-                    if min_val <= max_val:
-                        wrong_num = random.randint(int(min_val), int(max_val))
-                    else:
-                        # Fallback for edge cases
-                        offset = random.randint(int(abs_min_distance), int(abs_max_distance))
-                        if random.random() < 0.5:
-                            wrong_num = int(correct_num + offset)
-                        else:
-                            wrong_num = max(1, int(correct_num - offset))
-
-                    answer = str(wrong_num)
-
-                except (ValueError, TypeError):
+                fib_ranges = _fill_in_the_blank_ranges(correct_answer)
+                if fib_ranges is not None:
+                    # Choose a distance band based on weights, then above or below the correct answer
+                    above, below = self._rng.choices(fib_ranges, cum_weights=_FIB_BAND_CUM_WEIGHTS)[0]
+                    min_val, max_val = above if self._rng.random() < 0.5 else below
+                    answer = str(self._rng.randint(min_val, max_val))
+                else:
                     # If correct_answer is not numeric, generate generic wrong answers
-                    wrong_answers = ["wrong", "incorrect", "no idea", "idk", "pass", "skip"]
-                    answer = random.choice(wrong_answers)
+                    answer = self._rng.choice(_WRONG_FIB_TEXT)
         elif question_type == "pictionary":
             # Use real correct answer: "cloud" for the drawing
             if is_correct and correct_answer:
                 answer = correct_answer  # "cloud"
             else:
-                # Generate plausible wrong answers for cloud-themed drawing
-                wrong_answers = [
-                    "sky", "plane", "travel", "flight", "airplane", "mountain",
-                    "ocean", "water", "sun", "moon", "star", "bird", "wing"
-                ]
-                answer = random.choice(wrong_answers)
+                answer = self._rng.choice(_PICTIONARY_WRONG)
         elif question_type == "wheel_of_fortune":
             # Use real correct answer: "Holiday Cloud Journey"
             if is_correct and correct_answer:
                 answer = correct_answer  # "Holiday Cloud Journey"
             else:
-                # Generate plausible wrong phrase guesses for travel/teamwork theme
-                wrong_answers = [
-                    "Holiday Team Journey", "Cloud Travel Adventure", "Holiday Travel Team",
-                    "Cloud Team Holiday", "Journey Cloud Holiday", "Team Holiday Cloud",
-                    "Travel Holiday Cloud", "Holiday Cloud Travel", "Cloud Holiday Team"
-                ]
-                answer = random.choice(wrong_answers)
+                answer = self._rng.choice(_WHEEL_WRONG)
         else:
             # Fallback for unknown question types
-            answer = f"Sample answer {random.randint(1, 10)}"
+            answer = f"Sample answer {self._rng.randint(1, 10)}"
 
-        random.seed()  # Reset seed
         return answer
 
     def _generate_word_cloud_answer(self) -> str:
         """Generate diverse, realistic word cloud answers"""
-        # Mix of single words and short phrases for good clustering
-        word_cloud_answers = [
-            # Popular responses (will create large clusters)
-            "cookies", "chocolate", "family", "love", "peace", "joy",
-            "cookies", "chocolate", "family", "love", "peace", "joy",  # Repeated for clustering
-
-            # Medium frequency
-            "tradition", "giving", "happiness", "warmth", "light", "hope",
-            "tradition", "giving", "happiness", "warmth", "light", "hope",
-
-            # Individual responses (smaller clusters)
-            "eggnog", "fireplace", "snowflakes", "caroling", "presents",
-            "hot chocolate", "fruitcake", "pine tree", "reindeer", "sleigh",
-            "gingerbread", "candy cane", "stocking", "ornaments", "wreath",
-            "mistletoe", "chestnuts", "roasting", "chestnuts", "roasting",  # Phrases
-            "silent night", "holy night", "jingle bells", "santa claus"
-        ]
-
-        return random.choice(word_cloud_answers)
+        return self._rng.choice(_WORD_CLOUD_ANSWERS)
 
 class InteractiveLoadTester:
     """Manages 150 simulated participants"""
 
-    def __init__(self, num_users: int = 150):
+    def __init__(self, num_users: int = 150, server_url: str = DEFAULT_SERVER_URL):
         self.num_users = num_users
+        self.server_url = server_url
         self.participants = []
         self.tasks = []
         self.connected_count = 0
-        self.status_thread = None
+        # Live connected count, updated by participants so the monitor doesn't scan them all
+        self._connected_counter = 0
         self.running = False
 
+        # Resolve DNS once instead of once per participant
+        self.connect_targets = _resolve_server(server_url)
+
         # Create participants
         for i in range(num_users):
-            participant = SimulatedParticipant(i + 1)
+            participant = SimulatedParticipant(i + 1, server_url, tester=self, connect_targets=self.connect_targets)
             self.participants.append(participant)
 
     def start(self):
@@ -293,35 +468,39 @@ class InteractiveLoadTester:
 
         self.running = True
 
-        # Start status monitoring thread
-        self.status_thread = threading.Thread(target=self._monitor_status)
-        self.status_thread.daemon = True
-        self.status_thread.start()
-
         # Start participants with staggered connections
         async def run_all():
-            async def connect_with_delay(participant, delay):
-                """Connect a participant after waiting for their individual delay"""
-                if delay > 0:
-                    await asyncio.sleep(delay)
-                await participant.connect_and_listen()
-
+            # Status monitoring runs on the same loop as the participants
+            monitor_task = asyncio.create_task(self._monitor_status())
+            try:
+                await run_participants()
+            finally:
+                monitor_task.cancel()
+
+        async def run_participants():
             # Calculate delays for all users (spread over 10 seconds)
-            tasks = []
+            delays = []
             for i, participant in enumerate(self.participants):
                 base_delay = (i / (self.num_users - 1)) * 10 if self.num_users > 1 else 0
                 delay = base_delay + random.uniform(-0.5, 0.5)  # Add some randomness
-                delay = max(0, delay)  # Ensure non-negative
+                delays.append((max(0, delay), participant))  # Ensure non-negative
+            delays.sort(key=lambda item: item[0])
 
-                # Create task that will wait its delay then connect
-                task = asyncio.create_task(connect_with_delay(participant, delay))
-                tasks.append(task)
+            # Spawn each participant's task when its delay is reached, rather than
+            # creating every task up front just to sleep (TaskGroup needs Python 3.11)
+            tasks = []
+            elapsed = 0
+            for delay, participant in delays:
+                if delay > elapsed:
+                    await asyncio.sleep(delay - elapsed)
+                    elapsed = delay
+                tasks.append(asyncio.create_task(participant.connect_and_listen()))
 
-            # Start all tasks simultaneously - each waits their own delay
             await asyncio.gather(*tasks, return_exceptions=True)
+            tasks.clear()
 
         # Run in background
-        loop = asyncio.new_event_loop()
+        loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
 
         try:
@@ -334,14 +513,16 @@ class InteractiveLoadTester:
     def stop(self):
         """Stop the load test"""
         self.running = False
-        if self.status_thread:
-            self.status_thread.join(timeout=1.0)
         print("✅ Load test stopped")
 
-    def _monitor_status(self):
+    def _update_connected(self, delta: int):
+        """Adjust the connected count (participants and the monitor share one event loop, so no lock)"""
+        self._connected_counter += delta
+
+    async def _monitor_status(self):
         """Monitor and display connection status"""
         while self.running:
-            connected = sum(1 for p in self.participants if p.connected)
+            connected = self._connected_counter
             if connected != self.connected_count:
                 self.connected_count = connected
                 print(f"📊 Connected: {connected}/{self.num_users} users")
@@ -352,7 +533,7 @@ class InteractiveLoadTester:
                 print(f"👥 Active users: {', '.join(active_users)}...")
                 break  # Only show once when we reach 10+ users
 
-            time.sleep(2)
+            await asyncio.sleep(2)
 
 def main():
     """Main entry point"""
@@ -374,6 +555,7 @@ def main():
     print("4. Create questions of different types in admin interface")
     print("5. Start quiz and push questions - watch 150 users respond!")
     print()
+    print("Set LOADTEST_VERBOSE=1 to log every user's joins, answers and scores")
     print("Press Ctrl+C to stop the test")
     print("=" * 60)
 
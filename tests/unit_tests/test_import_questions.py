@@ -0,0 +1,72 @@
+"""
+Unit tests for the question import script
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import sessionmaker
+
+# Add project root (import_questions.py) and backend directory to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "backend"))
+
+import import_questions
+from models import Base, make_engine
+
+
+@pytest.fixture(scope="function")
+def import_engine(tmp_path, monkeypatch):
+    """Point the import script at a fresh SQLite file (indexes need a real file, not :memory:)"""
+    test_engine = make_engine(f"sqlite:///{tmp_path / 'import_test.db'}")
+    Base.metadata.create_all(bind=test_engine)
+    monkeypatch.setattr(import_questions, "SessionLocal", sessionmaker(autocommit=False, autoflush=False, bind=test_engine))
+    try:
+        yield test_engine
+    finally:
+        test_engine.dispose()
+
+
+def _write_questions(path, questions):
+    path.write_text(json.dumps(questions))
+    return str(path)
+
+
+class TestImportQuestions:
+    """Test import_questions_from_json against a database"""
+
+    def test_failed_import_keeps_indexes(self, import_engine, tmp_path):
+        """A failed drop-and-reimport must not leave the questions table without its indexes"""
+        indexes_before = sorted(index["name"] for index in inspect(import_engine).get_indexes("questions"))
+
+        input_file = _write_questions(tmp_path / "questions.json", [
+            {"type": "fill_in_the_blank", "content": "The capital of France is ___", "correct_answer": "Paris"},
+            # Passes validation but cannot be bound by sqlite3, so the insert fails
+            {"type": "fill_in_the_blank", "content": {"not": "text"}, "correct_answer": "1945"},
+        ])
+
+        with pytest.raises(DBAPIError):
+            import_questions.import_questions_from_json(input_file, drop_existing=True)
+
+        indexes_after = sorted(index["name"] for index in inspect(import_engine).get_indexes("questions"))
+        assert indexes_after == indexes_before
+        assert indexes_before  # Sanity check: there were indexes to lose
+
+    def test_drop_existing_import_rebuilds_indexes(self, import_engine, tmp_path):
+        """A successful drop-and-reimport inserts the questions and rebuilds the deferred indexes"""
+        indexes_before = sorted(index["name"] for index in inspect(import_engine).get_indexes("questions"))
+
+        input_file = _write_questions(tmp_path / "questions.json", [
+            {"type": "fill_in_the_blank", "content": "The capital of France is ___", "correct_answer": "Paris"},
+            {"type": "multiple_choice", "content": "What is 2 + 2?", "correct_answer": "4", "answers": ["3", "4", "5"]},
+        ])
+
+        result = import_questions.import_questions_from_json(input_file, drop_existing=True)
+
+        assert result["imported"] == 2
+        assert sorted(index["name"] for index in inspect(import_engine).get_indexes("questions")) == indexes_before
@@ -115,6 +115,28 @@ class TestQuestionModel:
         assert question.type == "multiple_choice"
         assert json.loads(question.answers) == ["2", "3", "4", "5"]
 
+    def test_question_content_hash(self, db_session):
+        """Test content hash is kept in sync with question content"""
+        import json
+        from models import question_content_hash
+
+        question = Question(
+            type="multiple_choice",
+            content="What is 2 + 2?",
+            correct_answer="4",
+            answers=json.dumps(["5", "4", "3", "2"])
+        )
+        db_session.add(question)
+        db_session.commit()
+
+        # Option order does not affect the hash
+        assert question.content_hash == question_content_hash("multiple_choice", "What is 2 + 2?", "4", ["2", "3", "4", "5"])
+
+        question.content = "What is 2 + 3?"
+        db_session.commit()
+
+        assert question.content_hash == question_content_hash("multiple_choice", "What is 2 + 3?", "4", ["2", "3", "4", "5"])
+
     def test_question_categories(self, db_session):
         """Test question categorization"""
         categories = ["geography", "history", "science", "general"]
@@ -209,6 +231,53 @@ class TestAnswerModel:
         assert answer.retry_count == 1
         assert answer.timestamp is not None
 
+    def test_answer_content_norm(self, db_session):
+        """Test answer content is normalized on insert"""
+        user = User(name="Test User", role="participant")
+        question = Question(
+            type="word_cloud",
+            content="One word for the year?",
+            correct_answer="Any"
+        )
+        game = Game(status="active")
+
+        db_session.add_all([user, question, game])
+        db_session.commit()
+
+        answer = Answer(
+            user_id=user.id,
+            question_id=question.id,
+            game_id=game.id,
+            content="  Teamwork "
+        )
+        db_session.add(answer)
+        db_session.commit()
+        db_session.refresh(answer)
+
+        assert answer.content == "  Teamwork "
+        assert answer.content_norm == "teamwork"
+
+    def test_answer_content_norm_backfill(self):
+        """Test the content_norm migration matches normalization of new answers"""
+        from sqlalchemy import create_engine, text
+        from models import Base, add_missing_columns, normalize_answer_content
+
+        # A database built before content_norm existed
+        test_engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(bind=test_engine)
+        contents = ["\tTeamwork\n", "  CAFÉ ", "Ünity"]
+        with test_engine.begin() as conn:
+            conn.execute(text("ALTER TABLE answers DROP COLUMN content_norm"))
+            conn.execute(text("INSERT INTO answers (user_id, question_id, game_id, content) VALUES (1, 1, 1, :content)"), [
+                {"content": content} for content in contents
+            ])
+
+        add_missing_columns(test_engine)
+
+        with test_engine.connect() as conn:
+            backfilled = [row.content_norm for row in conn.execute(text("SELECT content_norm FROM answers ORDER BY id"))]
+        assert backfilled == [normalize_answer_content(content) for content in contents]
+
     def test_answer_correctness_validation(self, db_session):
         """Test answer correctness validation"""
         user = User(name="Test User", role="participant")